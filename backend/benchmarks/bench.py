@@ -0,0 +1,323 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# In-process benchmarks of every API endpoint.
+#
+#   python benchmarks/bench.py                          run everything, print a table
+#   python benchmarks/bench.py --only projects-list --concurrency 50
+#   python benchmarks/bench.py --save-baseline          store results as the baseline
+#   python benchmarks/bench.py --baseline benchmarks/baseline.json
+#                                                       exit 1 on regressions
+#
+# The app is driven over ASGI with httpx, so no server or network is involved.
+# By default MongoDB is replaced by mongomock-motor, an in-memory stand-in;
+# pass --mongo-url to benchmark against a real (local, disposable) MongoDB.
+# Rate limits and the concurrency limiter are off unless set in the
+# environment, so they do not turn the measurements into 429s and 503s.
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+BENCHMARK_ENVIRONMENT = {
+    "DB_NAME": "portfolio_benchmark",
+    "CONTACT_RATE_PER_MINUTE": "0",
+    "CONTACT_EMAIL_RATE_PER_MINUTE": "0",
+    "WRITE_RATE_PER_MINUTE": "0",
+    "CONCURRENCY_LIMIT_ENABLED": "false",
+    "CACHE_GENERATION_POLL_INTERVAL": "0",
+    "PROFILE_ENABLED": "false",
+    "TRACE_LOG_ENABLED": "false",
+}
+
+NEW_PROJECT = {
+    "title": "Benchmark Project",
+    "description": "A project created by the benchmark suite",
+    "long_description": "A longer description of the project created by the benchmark suite",
+    "technologies": ["Python", "FastAPI", "MongoDB"],
+    "features": ["Fast", "Measured"],
+    "github": "https://github.com/example/benchmark",
+    "demo": "https://example.com/benchmark",
+    "image": "https://example.com/benchmark.png",
+    "category": "Benchmark",
+    "order": 100,
+}
+
+
+def prepare_environment(mongo_url):
+    """Configure the app before it is imported"""
+    for name, value in BENCHMARK_ENVIRONMENT.items():
+        os.environ.setdefault(name, value)
+
+    if mongo_url:
+        os.environ["MONGO_URL"] = mongo_url
+    else:
+        import motor.motor_asyncio
+        from mongomock_motor import AsyncMongoMockClient
+
+        os.environ["MONGO_URL"] = "mongodb://benchmark"
+        motor.motor_asyncio.AsyncIOMotorClient = AsyncMongoMockClient
+
+    sys.path.insert(0, str(BACKEND_DIR))
+
+
+class Scenario:
+    """One endpoint call; ``prepare`` runs untimed before the measurements"""
+
+    def __init__(self, name, method, path, expected=200, body=None, headers=None, prepare=None):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.expected = expected
+        self.body = body
+        self.headers = headers
+        self.prepare = prepare
+        self.state = {}
+
+    async def call(self, client, i: int):
+        path = self.path(self.state, i) if callable(self.path) else self.path
+        body = self.body(self.state, i) if callable(self.body) else self.body
+        headers = self.headers(self.state, i) if callable(self.headers) else self.headers
+        return await client.request(self.method, path, json=body, headers=headers)
+
+
+async def _create_projects(client, state, count):
+    ids = []
+    for i in range(count):
+        response = await client.post("/api/projects/", json={**NEW_PROJECT, "title": f"Benchmark Project {i}"})
+        response.raise_for_status()
+        ids.append(response.json()["id"])
+    state["ids"] = ids
+
+
+async def _fetch_etag(client, state, count):
+    response = await client.get("/api/projects/")
+    state["etag"] = response.headers["etag"]
+
+
+def scenarios():
+    return [
+        Scenario("portfolio", "GET", "/api/portfolio/"),
+        Scenario("personal", "GET", "/api/personal/"),
+        Scenario("experience-list", "GET", "/api/experience/"),
+        Scenario("projects-list", "GET", "/api/projects/"),
+        Scenario(
+            "projects-not-modified", "GET", "/api/projects/", expected=304,
+            headers=lambda state, i: {"If-None-Match": state["etag"]}, prepare=_fetch_etag,
+        ),
+        Scenario("projects-category", "GET", "/api/projects/category/Full%20Stack"),
+        Scenario("projects-categories", "GET", "/api/projects/categories"),
+        Scenario("projects-by-technology", "GET", "/api/projects/?technology=Python&technology=React&match=any"),
+        Scenario("skills-list", "GET", "/api/skills/"),
+        Scenario("achievements-list", "GET", "/api/achievements/"),
+        Scenario("education-list", "GET", "/api/education/"),
+        Scenario("technologies", "GET", "/api/technologies/"),
+        Scenario("search", "GET", "/api/search/?q=python%20react"),
+        Scenario("contact-messages", "GET", "/api/contact/messages?limit=50"),
+        Scenario(
+            "projects-create", "POST", "/api/projects/",
+            body=lambda state, i: {**NEW_PROJECT, "title": f"Created Project {i}"},
+        ),
+        Scenario(
+            "projects-update", "PUT", lambda state, i: f"/api/projects/{state['ids'][i % len(state['ids'])]}",
+            body=lambda state, i: {"description": f"Updated description {i}"}, prepare=_create_projects,
+        ),
+        Scenario(
+            "projects-delete", "DELETE", lambda state, i: f"/api/projects/{state['ids'][i]}",
+            prepare=_create_projects,
+        ),
+        Scenario(
+            "contact-submit", "POST", "/api/contact/",
+            body=lambda state, i: {
+                "name": "Benchmark Visitor",
+                "email": f"visitor-{i}-{uuid.uuid4().hex[:8]}@example.com",
+                "subject": "Benchmark",
+                "message": "Hello from the benchmark suite",
+            },
+        ),
+    ]
+
+
+def _percentile(quantiles, p: int) -> float:
+    return round(quantiles[p - 1] * 1000, 3)
+
+
+async def run_scenario(client, scenario, requests: int, concurrency: int, warmup: int, allocations: int):
+    if scenario.prepare is not None:
+        await scenario.prepare(client, scenario.state, warmup + requests + allocations)
+
+    for i in range(warmup):
+        await scenario.call(client, i)
+
+    # Workers share one iterator, so each request index is used exactly once
+    measured = iter(range(warmup, warmup + requests))
+    latencies = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for i in measured:
+            started = time.perf_counter()
+            response = await scenario.call(client, i)
+            elapsed = time.perf_counter() - started
+            if response.status_code == scenario.expected:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    result = {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "throughput_rps": round((len(latencies) + errors) / wall, 1),
+    }
+    if len(latencies) >= 2:
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        result.update(
+            mean_ms=round(statistics.fmean(latencies) * 1000, 3),
+            p50_ms=_percentile(quantiles, 50),
+            p95_ms=_percentile(quantiles, 95),
+            p99_ms=_percentile(quantiles, 99),
+        )
+
+    if allocations:
+        # Sequential and separate from the timings, tracemalloc slows everything down
+        peaks = []
+        tracemalloc.start()
+        try:
+            for i in range(warmup + requests, warmup + requests + allocations):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                await scenario.call(client, i)
+                peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        finally:
+            tracemalloc.stop()
+        result["peak_alloc_kb"] = round(statistics.median(peaks) / 1024, 1)
+
+    return result
+
+
+async def run(args) -> dict:
+    import httpx
+    import sync_content
+    from server import app
+
+    # httpx logs every request at INFO, which would be timed along with it
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    selected = [scenario for scenario in scenarios() if not args.only or scenario.name in args.only]
+    unknown = set(args.only or ()) - {scenario.name for scenario in selected}
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    await sync_content.sync_content(sync_content.load_content(sync_content.DEFAULT_CONTENT_FILE))
+    await app.router.startup()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            results = {}
+            for scenario in selected:
+                results[scenario.name] = await run_scenario(
+                    client, scenario, args.requests, args.concurrency, args.warmup, args.allocations
+                )
+                print_result(scenario.name, results[scenario.name])
+    finally:
+        await app.router.shutdown()
+
+    return {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "datastore": "mongodb" if args.mongo_url else "mongomock",
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+
+
+def print_result(name: str, result: dict):
+    print(
+        f"{name:<24} {result['throughput_rps']:>9.1f} req/s"
+        f"  p50 {result.get('p50_ms', 0):>8.3f} ms  p95 {result.get('p95_ms', 0):>8.3f} ms"
+        f"  p99 {result.get('p99_ms', 0):>8.3f} ms  alloc {result.get('peak_alloc_kb', '-'):>7} KB"
+        f"  errors {result['errors']}"
+    )
+
+
+def compare(results: dict, baseline: dict, tolerance: float):
+    """Return a description of every regression against the baseline"""
+    regressions = []
+    for name, result in results["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        if result["errors"] > base["errors"]:
+            regressions.append(f"{name}: {result['errors']} errors (baseline {base['errors']})")
+        if result["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {result['throughput_rps']} req/s (baseline {base['throughput_rps']})"
+            )
+        for key in ("p95_ms", "p99_ms"):
+            if key in result and key in base and result[key] > base[key] * (1 + tolerance):
+                regressions.append(f"{name}: {key} {result[key]} (baseline {base[key]})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every API endpoint in-process")
+    parser.add_argument("--only", nargs="+", help="scenario names to run")
+    parser.add_argument("--requests", default=500, type=int, help="measured requests per scenario")
+    parser.add_argument("--concurrency", default=10, type=int, help="concurrent clients per scenario")
+    parser.add_argument("--warmup", default=20, type=int, help="unmeasured requests per scenario")
+    parser.add_argument("--allocations", default=20, type=int,
+                        help="extra requests traced for allocations (0 skips)")
+    parser.add_argument("--mongo-url", help="benchmark against this MongoDB instead of the in-memory stand-in")
+    parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path, help="fail when results regress against this file")
+    parser.add_argument("--tolerance", default=0.25, type=float, help="allowed relative regression")
+    parser.add_argument("--save-baseline", action="store_true", help=f"also write the results to {DEFAULT_BASELINE.name}")
+    parser.add_argument("--list", action="store_true", help="list the scenarios and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for scenario in scenarios():
+            print(f"{scenario.name:<24} {scenario.method} {scenario.path if isinstance(scenario.path, str) else '...'}")
+        return
+
+    prepare_environment(args.mongo_url)
+    results = asyncio.run(run(args))
+
+    output = args.output or RESULTS_DIR / f"{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {output}")
+    if args.save_baseline:
+        DEFAULT_BASELINE.write_text(json.dumps(results, indent=2))
+        print(f"Baseline written to {DEFAULT_BASELINE}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Read cache configuration
+cache_ttl_seconds = float(os.environ.get('CACHE_TTL_SECONDS', '300'))
+cache_max_size = int(os.environ.get('CACHE_MAX_SIZE', '256'))
+
+
+class ReadCache:
+    """In-process read-through cache for the public GET routes.
+
+    Entries are keyed by ``(collection, query)`` so that a write to a
+    collection can drop every cached query of that collection at once.
+    Expired or least recently used entries are evicted first.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._locks = {}
+        self._generations = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    async def get_or_load(self, collection: str, query: str, loader):
+        """Return the cached value for the query, calling ``loader`` on a miss"""
+        if not self.enabled:
+            return await loader()
+
+        key = (collection, query)
+        hit, value = self._lookup(key)
+        if hit:
+            return value
+
+        # Only one coroutine per key goes to the database, the rest wait for it
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                hit, value = self._lookup(key)
+                if hit:
+                    return value
+
+                generation = self._generations.get(collection, 0)
+                value = await loader()
+                # Skip storing if a write invalidated the collection mid-load
+                if self._generations.get(collection, 0) == generation:
+                    self._store(key, value)
+                return value
+        finally:
+            if self._locks.get(key) is lock and not lock.locked():
+                del self._locks[key]
+
+    def invalidate(self, collection: str):
+        """Drop every cached query of a collection"""
+        self._generations[collection] = self._generations.get(collection, 0) + 1
+        for key in [key for key in self._entries if key[0] == collection]:
+            del self._entries[key]
+
+    def generation(self, collection: str) -> int:
+        """Number of times ``collection`` has been invalidated"""
+        return self._generations.get(collection, 0)
+
+    def clear(self):
+        for collection in {key[0] for key in self._entries}:
+            self.invalidate(collection)
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key, value):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+read_cache = ReadCache(cache_ttl_seconds, cache_max_size)
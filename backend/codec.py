@@ -0,0 +1,35 @@
+from typing import List, Type, TypeVar
+from pydantic import BaseModel
+from tracing import span
+
+# Mapping between stored MongoDB documents and the API models.
+#
+# Documents are only ever written from validated models, so reads build the
+# models with ``model_construct`` and skip validation entirely.
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def from_document(model: Type[ModelT], document: dict) -> ModelT:
+    """Build a model from a stored document, renaming ``_id`` to ``id``"""
+    with span("model"):
+        document["id"] = str(document.pop("_id"))
+        return model.model_construct(**document)
+
+
+def from_documents(model: Type[ModelT], documents: List[dict]) -> List[ModelT]:
+    """Build models from a list of stored documents"""
+    construct = model.model_construct
+    models = []
+    with span("model"):
+        for document in documents:
+            document["id"] = str(document.pop("_id"))
+            models.append(construct(**document))
+    return models
+
+
+def to_document(obj: BaseModel) -> dict:
+    """Dump a model to a document to store, renaming ``id`` to ``_id``"""
+    document = obj.model_dump()
+    document["_id"] = document.pop("id")
+    return document
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import os
+from dotenv import load_dotenv
+from pymongo import ReturnDocument
+from cache import read_cache
+from database import content_generation_collection
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# How often each worker checks for writes made by other workers or by
+# sync_content.py; this bounds how long a worker can serve stale content.
+# 0 disables polling (single worker deployments).
+cache_generation_poll_interval = float(os.environ.get('CACHE_GENERATION_POLL_INTERVAL', '1'))
+
+
+class GenerationWatcher:
+    """Keeps the in-process caches of every worker coherent.
+
+    Each cached collection has a generation counter in a small MongoDB
+    document (``{_id: <cache key>, generation: n}``). Writers bump it, and
+    every worker polls the counters and drops its local copy of any
+    collection whose generation moved since it last looked.
+    """
+
+    def __init__(self, collection, poll_interval: float):
+        self.collection = collection
+        self.poll_interval = poll_interval
+        self._seen = {}
+        self._listeners = []
+        self._task = None
+        self.polls = 0
+        self.invalidations = 0
+
+    def subscribe(self, names, callback):
+        """Await ``callback()`` after another writer changed one of ``names``"""
+        self._listeners.append((set(names), callback))
+
+    async def bump(self, name: str):
+        """Record a write to ``name`` so other workers drop their copies"""
+        document = await self.collection.find_one_and_update(
+            {"_id": name},
+            {"$inc": {"generation": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        # Only skip our own bump; if another writer got in between, the next
+        # poll still sees a generation we have not handled
+        if document["generation"] == self._seen.get(name, 0) + 1:
+            self._seen[name] = document["generation"]
+
+    async def poll(self):
+        """Invalidate every collection whose generation changed elsewhere"""
+        generations = {
+            document["_id"]: document["generation"]
+            async for document in self.collection.find({})
+        }
+        first_poll = self.polls == 0
+        self.polls += 1
+
+        changed = {name for name, generation in generations.items() if self._seen.get(name) != generation}
+        self._seen.update(generations)
+        if first_poll or not changed:
+            # The first poll only records the baseline; startup runs it
+            # before anything is cached
+            return
+
+        for name in changed:
+            read_cache.invalidate(name)
+        self.invalidations += len(changed)
+
+        for names, callback in self._listeners:
+            if names & changed:
+                try:
+                    await callback()
+                except Exception:
+                    logger.exception("Could not refresh after a change to %s", ", ".join(sorted(names & changed)))
+
+    def start(self):
+        if self._task is None and self.poll_interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {"polls": self.polls, "invalidations": self.invalidations, "generations": dict(self._seen)}
+
+    async def _run(self):
+        while True:
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception("Could not poll the content generations")
+            await asyncio.sleep(self.poll_interval)
+
+
+generation_watcher = GenerationWatcher(content_generation_collection, cache_generation_poll_interval)
+
+
+async def content_changed(name: str):
+    """Drop the local cache of ``name`` and tell the other workers to do so"""
+    read_cache.invalidate(name)
+    try:
+        await generation_watcher.bump(name)
+    except Exception:
+        # The write itself succeeded; other workers catch up when entries expire
+        logger.exception("Could not bump the %s generation", name)
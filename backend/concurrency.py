@@ -0,0 +1,161 @@
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Per-worker concurrency limit configuration
+concurrency_limit_enabled = os.environ.get('CONCURRENCY_LIMIT_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+concurrency_limit_initial = int(os.environ.get('CONCURRENCY_LIMIT_INITIAL', '20'))
+concurrency_limit_min = int(os.environ.get('CONCURRENCY_LIMIT_MIN', '4'))
+concurrency_limit_max = int(os.environ.get('CONCURRENCY_LIMIT_MAX', '200'))
+concurrency_queue_size = int(os.environ.get('CONCURRENCY_QUEUE_SIZE', '50'))
+concurrency_queue_timeout = float(os.environ.get('CONCURRENCY_QUEUE_TIMEOUT', '0.5'))
+concurrency_target_latency = float(os.environ.get('CONCURRENCY_TARGET_LATENCY_MS', '250')) / 1000
+
+
+class AdaptiveConcurrencyLimiter:
+    """Caps in-flight requests with an AIMD-adjusted limit.
+
+    Every request finishing under the target latency while the limit is in
+    use raises the limit by ``1 / limit`` (about +1 per round of requests).
+    A request over the target cuts the limit by 10%, at most once per target
+    latency interval so one slow burst does not collapse it. Requests over
+    the limit wait in a short bounded queue and are shed when it is full or
+    their wait times out.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, queue_size: int,
+                 queue_timeout: float, target_latency: float):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self._waiters = deque()
+        self._last_decrease = 0.0
+        self.admitted = 0
+        self.rejected = 0
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting briefly in the queue; False means shed"""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait timed out
+                self.admitted += 1
+                return True
+            waiter.cancel()
+            self._waiters.remove(waiter)
+            self.rejected += 1
+            return False
+        except asyncio.CancelledError:
+            # The client went away while queued; don't leak a handed-over slot
+            if waiter.done() and not waiter.cancelled():
+                self._free_slot()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            raise
+
+        self.admitted += 1
+        return True
+
+    def release(self, latency: float):
+        """Give the slot back and adapt the limit to the observed latency"""
+        now = time.monotonic()
+        if latency > self.target_latency:
+            if now - self._last_decrease > self.target_latency:
+                self.limit = max(self.minimum, self.limit * 0.9)
+                self._last_decrease = now
+        elif self.in_flight >= int(self.limit):
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+        self._free_slot()
+
+    def _free_slot(self):
+        self.in_flight -= 1
+        # Hand free slots directly to queued requests
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class ConcurrencyLimitMiddleware:
+    """ASGI middleware admitting requests through the limiter.
+
+    Shed requests get a 503 with Retry-After. Exempt paths such as ``/health``
+    are always admitted and not counted.
+    """
+
+    def __init__(self, app, limiter: AdaptiveConcurrencyLimiter, exempt_paths=("/health",)):
+        self.app = app
+        self.limiter = limiter
+        self.exempt_paths = set(exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.limiter.acquire():
+            await _send_overloaded(send)
+            return
+
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.limiter.release(time.monotonic() - started)
+
+
+async def _send_overloaded(send):
+    body = json.dumps({"detail": "Server is busy, please retry shortly"}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 503,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", b"1"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+concurrency_limiter = AdaptiveConcurrencyLimiter(
+    concurrency_limit_initial,
+    concurrency_limit_min,
+    concurrency_limit_max,
+    concurrency_queue_size,
+    concurrency_queue_timeout,
+    concurrency_target_latency,
+)
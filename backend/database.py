@@ -1,6 +1,9 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 from dotenv import load_dotenv
+from metrics import metrics_enabled, mongo_command_metrics
+from tracing import tracing_enabled, tracing_command_listener
+from slow_queries import slow_query_log
 
 load_dotenv()
 
@@ -8,7 +11,16 @@ load_dotenv()
 mongo_url = os.environ['MONGO_URL']
 database_name = os.environ.get('DB_NAME', 'portfolio_db')
 
-client = AsyncIOMotorClient(mongo_url)
+# Time every MongoDB command for /metrics, the request traces and the slow query log
+event_listeners = []
+if metrics_enabled:
+    event_listeners.append(mongo_command_metrics)
+if tracing_enabled:
+    event_listeners.append(tracing_command_listener)
+if slow_query_log.enabled:
+    event_listeners.append(slow_query_log)
+
+client = AsyncIOMotorClient(mongo_url, event_listeners=event_listeners)
 db = client[database_name]
 
 # Collections
@@ -19,6 +31,7 @@ skill_collection = db.skills
 achievement_collection = db.achievements
 education_collection = db.education
 contact_message_collection = db.contact_messages
+content_generation_collection = db.content_generations
 
 async def close_db_connection():
     client.close()
\ No newline at end of file
@@ -0,0 +1,85 @@
+from collections import defaultdict
+from cache import read_cache
+
+# Technology -> ids map for projects and experience, maintained by the write
+# routes so technology filters and facet counts never scan the full lists.
+# Technologies match case-insensitively; the first spelling seen is displayed.
+
+KINDS = ("project", "experience")
+
+# Collation of the technologies indexes, so MongoDB matches case-insensitively too
+TECHNOLOGY_COLLATION = {"locale": "en", "strength": 2}
+
+
+class TechnologyIndex:
+    def __init__(self):
+        self.ready = False
+        self._ids = {kind: defaultdict(set) for kind in KINDS}
+        self._technologies = {kind: {} for kind in KINDS}
+        self._names = {}
+
+    def add(self, kind: str, model):
+        """Index a model's technologies, replacing any earlier version of it"""
+        self.remove(kind, model.id)
+        keys = set()
+        for technology in model.technologies:
+            key = technology.strip().casefold()
+            if not key:
+                continue
+            self._names.setdefault(key, technology.strip())
+            self._ids[kind][key].add(model.id)
+            keys.add(key)
+        self._technologies[kind][model.id] = keys
+
+    def remove(self, kind: str, model_id: str):
+        for key in self._technologies[kind].pop(model_id, ()):
+            ids = self._ids[kind][key]
+            ids.discard(model_id)
+            if not ids:
+                del self._ids[kind][key]
+
+    def match(self, kind: str, technologies, match_all: bool = True) -> set:
+        """Ids using all (or any) of the technologies"""
+        sets = [self._ids[kind].get(technology.strip().casefold(), set()) for technology in technologies]
+        if not sets:
+            return set(self._technologies[kind])
+        return set.intersection(*sets) if match_all else set.union(*sets)
+
+    def facets(self):
+        """Every technology with its project and experience usage counts"""
+        keys = set(self._ids["project"]) | set(self._ids["experience"])
+        facets = [
+            {
+                "name": self._names[key],
+                "projects": len(self._ids["project"].get(key, ())),
+                "experience": len(self._ids["experience"].get(key, ())),
+            }
+            for key in keys
+        ]
+        for facet in facets:
+            facet["count"] = facet["projects"] + facet["experience"]
+        return sorted(facets, key=lambda facet: (-facet["count"], facet["name"].casefold()))
+
+
+technology_index = TechnologyIndex()
+
+
+async def build_technology_index():
+    """(Re)build the map from the active projects and experience"""
+    from routes.projects import get_active_projects
+    from routes.experience import get_active_experiences
+
+    # A local write during the load updates the live map, which the swap
+    # would throw away, so load again until no write got in between
+    while True:
+        generations = [read_cache.generation(name) for name in ("projects", "experience")]
+        index = TechnologyIndex()
+        for kind, getter in (("project", get_active_projects), ("experience", get_active_experiences)):
+            for model in (await getter()).content:
+                index.add(kind, model)
+        if [read_cache.generation(name) for name in ("projects", "experience")] == generations:
+            break
+    index.ready = True
+
+    # Swap in one step so concurrent requests never see a half-built map
+    technology_index.__dict__.update(index.__dict__)
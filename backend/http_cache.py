@@ -0,0 +1,249 @@
+import gzip
+import hashlib
+import os
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+from dotenv import load_dotenv
+from fastapi import Request, Response
+from pydantic_core import to_json
+from tracing import span
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional, gzip is always available
+    brotli = None
+
+load_dotenv()
+
+# Serve the cached, already encoded JSON body instead of re-validating the
+# content through the route's response_model on every request
+preserialized_responses = os.environ.get('PRESERIALIZED_RESPONSES', 'true').lower() in ('1', 'true', 'yes')
+
+# Cached bodies are compressed once per content version and encoding
+compression_enabled = os.environ.get('COMPRESSION_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+compression_min_size = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+# Live compression runs on the event loop, so keep it to a few milliseconds
+compression_brotli_quality = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', '5'))
+compression_gzip_level = int(os.environ.get('COMPRESSION_GZIP_LEVEL', '6'))
+
+# Supported content-codings, most preferred first
+ENCODINGS = ("br", "gzip")
+
+
+def compress(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """Compress ``body`` with ``encoding``, at the maximum level when ``best``"""
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if best else compression_brotli_quality)
+    return gzip.compress(body, compresslevel=9 if best else compression_gzip_level, mtime=0)
+
+
+class Resource:
+    """Content of a read endpoint together with its HTTP validators"""
+
+    def __init__(self, content: Any, etag: Optional[str], last_modified: Optional[datetime]):
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self._body = None
+        self._compressed = {}
+
+    @classmethod
+    def from_encoded(cls, body: bytes, compressed: dict, etag: Optional[str], last_modified: Optional[datetime]):
+        """Build a resource from bodies that were encoded ahead of time"""
+        resource = cls(None, etag, last_modified)
+        resource._body = body
+        resource._compressed = dict(compressed)
+        return resource
+
+    @property
+    def body(self) -> bytes:
+        """JSON encoding of the content, produced once per resource version"""
+        if self._body is None:
+            with span("encode"):
+                self._body = to_json(self.content)
+        return self._body
+
+    def compressed_body(self, encoding: str) -> bytes:
+        """Body compressed with ``encoding``, produced once per resource version"""
+        body = self._compressed.get(encoding)
+        if body is None:
+            with span("compress"):
+                body = compress(self.body, encoding)
+            self._compressed[encoding] = body
+        return body
+
+
+async def last_write(collection) -> Optional[datetime]:
+    """Newest ``updated_at`` in ``collection``, soft-deleted documents included.
+
+    Soft deletes set ``updated_at`` too, so unlike the newest ``updated_at``
+    of the active documents this never moves backwards.
+    """
+    document = await collection.find_one({}, {"updated_at": 1}, sort=[("updated_at", -1)])
+    return document.get("updated_at") if document else None
+
+
+def versioned(content, last_modified: Optional[datetime] = None) -> Resource:
+    """Wrap a model, a list of models or None with an ETag and Last-Modified.
+
+    The ETag hashes every id with its ``updated_at`` in response order, so it
+    changes on any create, update, reorder or soft delete. Last-Modified is
+    ``last_modified`` (the collection's :func:`last_write`) when given, or the
+    newest ``updated_at`` of the returned documents.
+    """
+    if content is None:
+        return Resource(None, None, None)
+
+    items = content if isinstance(content, list) else [content]
+    digest = hashlib.sha256()
+    for item in items:
+        digest.update(f"{item.id}:{item.updated_at.isoformat()};".encode())
+
+    if last_modified is None:
+        last_modified = max((item.updated_at for item in items), default=None)
+    return Resource(content, f'"{digest.hexdigest()[:32]}"', last_modified)
+
+
+def aggregated(content, rows, last_modified: Optional[datetime]) -> Resource:
+    """Wrap content built from aggregation rows.
+
+    The ETag hashes the rows themselves, so it changes whenever a grouped
+    value does. Last-Modified is the collection's :func:`last_write`.
+    """
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update(f"{sorted(row.items())};".encode())
+
+    return Resource(content, f'"{digest.hexdigest()[:32]}"', last_modified)
+
+
+def combine(content, *resources: Resource) -> Resource:
+    """Build a resource whose validators cover several other resources"""
+    digest = hashlib.sha256()
+    for resource in resources:
+        digest.update(f"{resource.etag};".encode())
+
+    last_modified = max((r.last_modified for r in resources if r.last_modified), default=None)
+    return Resource(content, f'"{digest.hexdigest()[:32]}"', last_modified)
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.replace(microsecond=0), usegmt=True)
+
+
+def _strip_encoding(etag: str) -> str:
+    for encoding in ENCODINGS:
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+    return etag
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Compare against the version's ETag, ignoring the content-coding suffix"""
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if _strip_encoding(candidate) == etag:
+            return True
+    return False
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since is None:
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def is_not_modified(request: Request, resource: Resource) -> bool:
+    """Evaluate If-None-Match, falling back to If-Modified-Since (RFC 9110)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return resource.etag is not None and _etag_matches(if_none_match, resource.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and resource.last_modified is not None:
+        return _not_modified_since(if_modified_since, resource.last_modified)
+
+    return False
+
+
+def negotiate_encoding(request: Request, size: int) -> Optional[str]:
+    """Pick the best content-coding the client accepts for a body of ``size`` bytes"""
+    if not compression_enabled or size < compression_min_size:
+        return None
+
+    accepted = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in ENCODINGS:
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, 0) > 0:
+            return encoding
+    return None
+
+
+def validator_headers(resource: Resource, encoding: Optional[str] = None) -> dict:
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if resource.etag:
+        # Each encoded representation gets its own strong ETag
+        headers["ETag"] = resource.etag[:-1] + f'-{encoding}"' if encoding else resource.etag
+    if resource.last_modified:
+        headers["Last-Modified"] = _http_date(resource.last_modified)
+    return headers
+
+
+def conditional(request: Request, response: Response, resource: Resource):
+    """Return a 304 response if the client copy is current, else the content.
+
+    With pre-serialized responses enabled the cached JSON body is returned
+    as-is (or its cached compressed form, depending on Accept-Encoding),
+    skipping the response_model round trip. Otherwise the validator
+    headers are set on the injected ``response`` and FastAPI serializes the
+    content as usual.
+    """
+    if not preserialized_responses:
+        headers = validator_headers(resource)
+        if is_not_modified(request, resource):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return resource.content
+
+    return encoded_response(request, resource)
+
+
+def encoded_response(request: Request, resource: Resource) -> Response:
+    """Serve the resource's encoded body, or a 304 if the client copy is current"""
+    encoding = negotiate_encoding(request, len(resource.body))
+    headers = validator_headers(resource, encoding)
+    if is_not_modified(request, resource):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(content=resource.compressed_body(encoding), media_type="application/json", headers=headers)
+    return Response(content=resource.body, media_type="application/json", headers=headers)
@@ -0,0 +1,144 @@
+import argparse
+import asyncio
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from database import (
+    personal_info_collection, experience_collection, project_collection,
+    skill_collection, achievement_collection, education_collection,
+    contact_message_collection
+)
+from facets import TECHNOLOGY_COLLATION
+
+# Partial indexes only hold active documents, so soft-deleted history does
+# not grow the indexes the public routes read from
+ACTIVE = {"is_active": True}
+
+# Last-Modified is the newest updated_at of the whole collection, soft
+# deletes included, so this index is not partial
+LAST_WRITE = IndexModel([("updated_at", DESCENDING)], name="updated_at_desc")
+
+INDEXES = [
+    (personal_info_collection, [
+        IndexModel([("is_active", ASCENDING)], name="active", partialFilterExpression=ACTIVE),
+        LAST_WRITE,
+    ]),
+    (experience_collection, [
+        IndexModel([("order", ASCENDING)], name="active_order", partialFilterExpression=ACTIVE),
+        LAST_WRITE,
+        IndexModel(
+            [("technologies", ASCENDING), ("order", ASCENDING)],
+            name="active_technologies_order",
+            partialFilterExpression=ACTIVE,
+            collation=TECHNOLOGY_COLLATION,
+        ),
+    ]),
+    (project_collection, [
+        IndexModel([("order", ASCENDING)], name="active_order", partialFilterExpression=ACTIVE),
+        LAST_WRITE,
+        IndexModel(
+            [("category", ASCENDING), ("order", ASCENDING)],
+            name="active_category_order",
+            partialFilterExpression=ACTIVE,
+        ),
+        IndexModel(
+            [("technologies", ASCENDING), ("order", ASCENDING)],
+            name="active_technologies_order",
+            partialFilterExpression=ACTIVE,
+            collation=TECHNOLOGY_COLLATION,
+        ),
+    ]),
+    (skill_collection, [
+        IndexModel([("order", ASCENDING)], name="active_order", partialFilterExpression=ACTIVE),
+        LAST_WRITE,
+    ]),
+    (achievement_collection, [
+        IndexModel([("order", ASCENDING)], name="active_order", partialFilterExpression=ACTIVE),
+        LAST_WRITE,
+    ]),
+    (education_collection, [
+        IndexModel([("order", ASCENDING)], name="active_order", partialFilterExpression=ACTIVE),
+        LAST_WRITE,
+    ]),
+    (contact_message_collection, [
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_desc"),
+        IndexModel(
+            [("is_read", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="is_read_created_at_desc",
+        ),
+    ]),
+]
+
+# The queries issued by the route modules: (description, collection, filter, sort)
+ROUTE_QUERIES = [
+    ("GET /api/personal/", personal_info_collection, ACTIVE, None),
+    ("GET /api/experience/", experience_collection, ACTIVE, [("order", ASCENDING)]),
+    ("GET /api/projects/", project_collection, ACTIVE, [("order", ASCENDING)]),
+    (
+        "GET /api/projects/category/{category}",
+        project_collection,
+        {"category": "AI/ML", "is_active": True},
+        [("order", ASCENDING)],
+    ),
+    # The $match stage of GET /api/projects/categories
+    ("GET /api/projects/categories", project_collection, ACTIVE, None),
+    # The Last-Modified lookup every content collection runs alongside its list
+    ("Last-Modified of GET /api/projects/", project_collection, {}, [("updated_at", DESCENDING)]),
+    ("GET /api/skills/", skill_collection, ACTIVE, [("order", ASCENDING)]),
+    ("GET /api/achievements/", achievement_collection, ACTIVE, [("order", ASCENDING)]),
+    ("GET /api/education/", education_collection, ACTIVE, [("order", ASCENDING)]),
+    (
+        "GET /api/contact/messages",
+        contact_message_collection,
+        {},
+        [("created_at", DESCENDING), ("_id", DESCENDING)],
+    ),
+    (
+        "GET /api/contact/messages?is_read=false",
+        contact_message_collection,
+        {"is_read": False},
+        [("created_at", DESCENDING), ("_id", DESCENDING)],
+    ),
+]
+
+
+async def ensure_indexes():
+    """Create the indexes the routes rely on (no-op when they already exist)"""
+    await asyncio.gather(*(
+        collection.create_indexes(indexes) for collection, indexes in INDEXES
+    ))
+
+
+def plan_stages(plan):
+    """Flatten a winning plan into its stage names, outermost first"""
+    stages = [plan.get("stage")]
+    if "inputStage" in plan:
+        stages += plan_stages(plan["inputStage"])
+    for child in plan.get("inputStages", []):
+        stages += plan_stages(child)
+    return stages
+
+
+async def explain_route_queries():
+    """Print the winning plan of every route query"""
+    for description, collection, query, sort in ROUTE_QUERIES:
+        cursor = collection.find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        explanation = await cursor.explain()
+        plan = explanation["queryPlanner"]["winningPlan"]
+        stages = plan_stages(plan)
+        status = "ok" if "IXSCAN" in stages and "COLLSCAN" not in stages and "SORT" not in stages else "CHECK"
+        print(f"[{status}] {description}: {' <- '.join(stage for stage in stages if stage)}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Manage the MongoDB indexes used by the API routes")
+    parser.add_argument("--explain", action="store_true", help="print the query plan of every route query")
+    args = parser.parse_args()
+
+    await ensure_indexes()
+    print("Indexes are up to date")
+    if args.explain:
+        await explain_route_queries()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+import argparse
+import importlib.util
+import multiprocessing
+import os
+from dotenv import load_dotenv
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+
+load_dotenv()
+
+# Production launcher: a Gunicorn master supervising Uvicorn workers.
+#
+#   python launcher.py                 one worker per CPU on 0.0.0.0:8001
+#   kill -HUP <master pid>             gracefully replace every worker
+#   kill -TERM <master pid>            finish in-flight requests and stop
+#
+# The app is imported once in the master and forked into the workers, so a
+# broken deploy fails before any worker starts. Preloaded workers keep the
+# master's code across a HUP; start with --no-preload to pick up new code on
+# reload instead. The rate and concurrency limits apply per worker.
+
+bind = os.environ.get('BIND', '0.0.0.0:8001')
+web_concurrency = int(os.environ.get('WEB_CONCURRENCY', '0'))  # 0 means one worker per CPU
+event_loop = os.environ.get('EVENT_LOOP', 'auto')
+http_parser = os.environ.get('HTTP_PARSER', 'auto')
+keep_alive_seconds = int(os.environ.get('KEEP_ALIVE_SECONDS', '5'))
+listen_backlog = int(os.environ.get('LISTEN_BACKLOG', '2048'))
+worker_limit_concurrency = int(os.environ.get('WORKER_LIMIT_CONCURRENCY', '0'))  # 0 means unlimited
+graceful_timeout = int(os.environ.get('GRACEFUL_TIMEOUT', '30'))
+max_requests = int(os.environ.get('MAX_REQUESTS', '0'))  # recycle workers after this many requests
+preload_app = os.environ.get('PRELOAD_APP', 'true').lower() in ('1', 'true', 'yes')
+
+
+def _resolve(choice: str, fast: str, module: str, fallback: str) -> str:
+    """Pick the fast implementation for "auto" when it is installed"""
+    if choice != "auto":
+        return choice
+    return fast if importlib.util.find_spec(module) else fallback
+
+
+class PortfolioApplication(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from server import app
+        return app
+
+
+def build_options(args) -> dict:
+    loop = _resolve(args.loop, "uvloop", "uvloop", "asyncio")
+    http = _resolve(args.http, "httptools", "httptools", "h11")
+
+    class PortfolioWorker(UvicornWorker):
+        CONFIG_KWARGS = {
+            "loop": loop,
+            "http": http,
+            "limit_concurrency": args.limit_concurrency or None,
+        }
+
+    return {
+        "bind": args.bind,
+        "workers": args.workers or multiprocessing.cpu_count(),
+        "worker_class": PortfolioWorker,
+        "keepalive": args.keep_alive,
+        "backlog": args.backlog,
+        "graceful_timeout": args.graceful_timeout,
+        "max_requests": args.max_requests,
+        "max_requests_jitter": args.max_requests // 10,
+        "preload_app": args.preload,
+        "accesslog": "-",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the API with one Uvicorn worker per CPU under Gunicorn")
+    parser.add_argument("--bind", default=bind, help="address to listen on")
+    parser.add_argument("--workers", default=web_concurrency, type=int, help="worker processes (0: one per CPU)")
+    parser.add_argument("--loop", default=event_loop, choices=["auto", "uvloop", "asyncio"])
+    parser.add_argument("--http", default=http_parser, choices=["auto", "httptools", "h11"])
+    parser.add_argument("--keep-alive", default=keep_alive_seconds, type=int, help="idle keep-alive seconds")
+    parser.add_argument("--backlog", default=listen_backlog, type=int, help="pending connection queue size")
+    parser.add_argument("--limit-concurrency", default=worker_limit_concurrency, type=int,
+                        help="connections per worker before answering 503 (0: unlimited)")
+    parser.add_argument("--graceful-timeout", default=graceful_timeout, type=int,
+                        help="seconds in-flight requests get on reload or shutdown")
+    parser.add_argument("--max-requests", default=max_requests, type=int,
+                        help="restart a worker after this many requests (0: never)")
+    parser.add_argument("--preload", default=preload_app, action=argparse.BooleanOptionalAction,
+                        help="import the app once in the master before forking")
+    args = parser.parse_args()
+
+    PortfolioApplication(build_options(args)).run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from dotenv import load_dotenv
+from pymongo import monitoring
+
+load_dotenv()
+
+# Prometheus metrics for the API and its MongoDB commands.
+#
+# Values live in the worker process that recorded them; with several workers
+# each one exposes its own /metrics. MongoDB events arrive on Motor's executor
+# threads, so every metric guards its values with a lock.
+
+metrics_enabled = os.environ.get('METRICS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MONGO_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, description: str, labelnames=()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def render(self):
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} {self.kind}"
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield from self._render_sample(labels, value)
+
+    def _render_sample(self, labels, value):
+        yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                # One count per bucket plus +Inf, then the sum
+                counts = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[index] += 1
+            counts[-1] += value
+
+    def _render_sample(self, labels, counts):
+        cumulative = 0
+        for bound, count in zip(self.buckets + ("+Inf",), counts):
+            cumulative += count
+            le = bound if bound == "+Inf" else _format_value(bound)
+            yield f"{self.name}_bucket{_format_labels(self.labelnames, labels, [('le', le)])} {cumulative}"
+        yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(counts[-1])}"
+        yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.register(Counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+))
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route")
+))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+))
+http_response_size = registry.register(Histogram(
+    "http_response_size_bytes", "HTTP response body size by route template", ("method", "route"), SIZE_BUCKETS
+))
+mongo_command_duration = registry.register(Histogram(
+    "mongodb_command_duration_seconds", "MongoDB command latency by collection and command",
+    ("collection", "command"), MONGO_LATENCY_BUCKETS
+))
+mongo_command_failures = registry.register(Counter(
+    "mongodb_command_failures_total", "Failed MongoDB commands by collection and command", ("collection", "command")
+))
+
+
+def route_template(scope) -> str:
+    """The matched route path (e.g. ``/api/projects/{project_id}``), so ids do not explode the labels"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request counts, latency and response sizes"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        started = time.perf_counter()
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            route = route_template(scope)
+            http_request_duration.observe(time.perf_counter() - started, scope["method"], route)
+            http_response_size.observe(size, scope["method"], route)
+            http_requests.inc(scope["method"], route, str(status))
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Times every MongoDB command per collection"""
+
+    def __init__(self):
+        self._pending = {}
+
+    def started(self, event):
+        # getMore names the cursor id first and the collection separately
+        key = "collection" if event.command_name == "getMore" else event.command_name
+        collection = event.command.get(key)
+        if not isinstance(collection, str):
+            collection = "none"
+        self._pending[(event.connection_id, event.request_id)] = collection
+
+    def succeeded(self, event):
+        collection = self._pending.pop((event.connection_id, event.request_id), "none")
+        mongo_command_duration.observe(event.duration_micros / 1_000_000, collection, event.command_name)
+
+    def failed(self, event):
+        collection = self._pending.pop((event.connection_id, event.request_id), "none")
+        mongo_command_duration.observe(event.duration_micros / 1_000_000, collection, event.command_name)
+        mongo_command_failures.inc(collection, event.command_name)
+
+
+mongo_command_metrics = MongoCommandMetrics()
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 import uuid
 
@@ -17,4 +18,10 @@ class ContactMessage(ContactMessageBase):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Config:
-        populate_by_name = True
\ No newline at end of file
+        populate_by_name = True
+
+class ContactMessagePage(BaseModel):
+    messages: List[ContactMessage]
+    next_cursor: Optional[str] = None
+    total: int
+    unread: int
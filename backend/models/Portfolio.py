@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from models.PersonalInfo import PersonalInfo
+from models.Experience import Experience
+from models.Project import Project
+from models.Skill import Skill
+from models.Achievement import Achievement
+from models.Education import Education
+
+class Portfolio(BaseModel):
+    personal_info: Optional[PersonalInfo] = None
+    experience: List[Experience] = []
+    projects: List[Project] = []
+    skills: List[Skill] = []
+    achievements: List[Achievement] = []
+    education: List[Education] = []
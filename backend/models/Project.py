@@ -37,4 +37,9 @@ class Project(ProjectBase):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Config:
-        populate_by_name = True
\ No newline at end of file
+        populate_by_name = True
+
+class ProjectCategory(BaseModel):
+    name: str
+    count: int
+    order: int
\ No newline at end of file
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import List
+
+class SearchHit(BaseModel):
+    type: str
+    id: str
+    title: str
+    score: float
+
+class SearchResults(BaseModel):
+    query: str
+    total: int
+    hits: List[SearchHit]
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+class TechnologyFacet(BaseModel):
+    name: str
+    projects: int
+    experience: int
+    count: int
@@ -0,0 +1,173 @@
+import asyncio
+import cProfile
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Opt-in profiling of single live requests.
+#
+# A request is profiled when it carries ``X-Profile-Token: <PROFILE_TOKEN>``
+# or is picked by PROFILE_SAMPLE_RATE. Profiles are written to PROFILE_DIR:
+#
+#   sample    statistical sampler, collapsed stacks (``.folded``) for
+#             flamegraph.pl, inferno or speedscope
+#   cprofile  deterministic cProfile stats (``.prof``) for snakeviz or
+#             flameprof
+#
+# Both watch the event loop thread, so requests running concurrently with
+# the profiled one show up in its profile too. With PROFILE_ENABLED=false
+# the middleware is not installed at all.
+
+profile_enabled = os.environ.get('PROFILE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+profile_token = os.environ.get('PROFILE_TOKEN', '')
+profile_sample_rate = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+profile_mode = os.environ.get('PROFILE_MODE', 'sample')
+profile_interval = float(os.environ.get('PROFILE_INTERVAL_MS', '1')) / 1000
+profile_dir = Path(os.environ.get('PROFILE_DIR', Path(__file__).parent / 'profiles'))
+profile_max_files = int(os.environ.get('PROFILE_MAX_FILES', '50'))
+
+TOKEN_HEADER = b"x-profile-token"
+
+
+class StackSampler:
+    """Samples the stack of one thread from a background thread"""
+
+    extension = "folded"
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks = Counter()
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self):
+        self._sampler.start()
+
+    def stop(self):
+        self._stop.set()
+        self._sampler.join()
+
+    @property
+    def captured(self) -> bool:
+        return bool(self.stacks)
+
+    def _run(self):
+        # Sample on start and on stop too, so requests shorter than the
+        # interval still leave a profile
+        self._sample()
+        while not self._stop.wait(self.interval):
+            self._sample()
+        self._sample()
+
+    def _sample(self):
+        frame = sys._current_frames().get(self._thread_id)
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if stack:
+            self.stacks[";".join(reversed(stack))] += 1
+
+    def dump(self, path: Path):
+        path.write_text("".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common()))
+
+
+class DeterministicProfiler:
+    """cProfile over the event loop thread"""
+
+    extension = "prof"
+
+    def __init__(self, interval: float):
+        self._profile = cProfile.Profile()
+
+    def start(self):
+        self._profile.enable()
+
+    def stop(self):
+        self._profile.disable()
+
+    @property
+    def captured(self) -> bool:
+        return bool(self._profile.getstats())
+
+    def dump(self, path: Path):
+        self._profile.dump_stats(path)
+
+
+PROFILERS = {"sample": StackSampler, "cprofile": DeterministicProfiler}
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", text).strip("-") or "root"
+
+
+def _prune(directory: Path, keep: int):
+    """Delete the oldest profiles beyond ``keep``"""
+    profiles = sorted(
+        (path for path in directory.iterdir() if path.suffix in (".folded", ".prof")),
+        key=lambda path: path.stat().st_mtime,
+    )
+    for path in profiles[:max(0, len(profiles) - keep)]:
+        path.unlink(missing_ok=True)
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests picked by token or sampling"""
+
+    def __init__(self, app, mode: str = profile_mode):
+        self.app = app
+        self.profiler_class = PROFILERS[mode]
+        self._active = False
+
+    def _wants_profile(self, scope) -> bool:
+        if profile_token:
+            for name, value in scope["headers"]:
+                if name == TOKEN_HEADER:
+                    return hmac.compare_digest(value, profile_token.encode())
+        return profile_sample_rate > 0 and random.random() < profile_sample_rate
+
+    async def __call__(self, scope, receive, send):
+        # One profile at a time, the profilers watch the whole thread
+        if scope["type"] != "http" or self._active or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        file_name = (
+            f"{int(time.time() * 1000)}-{os.getpid()}-{scope['method']}-{_slug(scope['path'])}"
+            f".{self.profiler_class.extension}"
+        )
+
+        profiler = self.profiler_class(profile_interval)
+
+        async def send_with_profile(message):
+            # Empty profiles are not saved, so only name the file once there is something in it
+            if message["type"] == "http.response.start" and profiler.captured:
+                message.setdefault("headers", []).append((b"x-profile", file_name.encode()))
+            await send(message)
+
+        self._active = True
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            profiler.stop()
+            self._active = False
+            if profiler.captured:
+                await asyncio.to_thread(self._save, profiler, file_name)
+
+    @staticmethod
+    def _save(profiler, file_name: str):
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump(profile_dir / file_name)
+        _prune(profile_dir, profile_max_files)
@@ -0,0 +1,112 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+from dotenv import load_dotenv
+from fastapi import HTTPException, Request
+
+load_dotenv()
+
+# Rate limit configuration, 0 requests per minute disables a limiter
+contact_rate_per_minute = float(os.environ.get('CONTACT_RATE_PER_MINUTE', '5'))
+contact_rate_burst = int(os.environ.get('CONTACT_RATE_BURST', '5'))
+contact_email_rate_per_minute = float(os.environ.get('CONTACT_EMAIL_RATE_PER_MINUTE', '2'))
+contact_email_rate_burst = int(os.environ.get('CONTACT_EMAIL_RATE_BURST', '3'))
+write_rate_per_minute = float(os.environ.get('WRITE_RATE_PER_MINUTE', '60'))
+write_rate_burst = int(os.environ.get('WRITE_RATE_BURST', '30'))
+trust_forwarded_for = os.environ.get('RATE_LIMIT_TRUST_PROXY', 'false').lower() in ('1', 'true', 'yes')
+
+
+class TokenBucketLimiter:
+    """In-memory token buckets, one per key.
+
+    Buckets are kept in least recently used order, so idle ones are evicted
+    from the front in amortized O(1) as part of regular calls. An idle bucket
+    has refilled completely, so dropping it does not change any decision.
+    """
+
+    def __init__(self, name: str, rate_per_minute: float, burst: int, max_buckets: int = 100_000):
+        self.name = name
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self.max_buckets = max_buckets
+        self.idle_seconds = burst / self.rate if self.rate > 0 else 0
+        self._buckets = OrderedDict()
+        self.allowed = 0
+        self.limited = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0 and self.burst > 0
+
+    def acquire(self, key: str) -> Optional[float]:
+        """Take a token for ``key``; return None if allowed, else seconds to wait"""
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        bucket = self._buckets.pop(key, None)
+        if bucket is None:
+            tokens = float(self.burst)
+        else:
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+
+        if tokens >= 1:
+            tokens -= 1
+            retry_after = None
+            self.allowed += 1
+        else:
+            retry_after = (1 - tokens) / self.rate
+            self.limited += 1
+
+        self._buckets[key] = (tokens, now)
+        self._evict(now)
+        return retry_after
+
+    def check(self, key: str):
+        """Raise a 429 error if ``key`` is out of tokens"""
+        retry_after = self.acquire(key)
+        if retry_after is not None:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests, please slow down",
+                headers={"Retry-After": str(max(1, round(retry_after)))}
+            )
+
+    def stats(self) -> dict:
+        return {"allowed": self.allowed, "limited": self.limited, "buckets": len(self._buckets)}
+
+    def _evict(self, now: float):
+        while self._buckets:
+            key, (tokens, last_seen) = next(iter(self._buckets.items()))
+            if len(self._buckets) <= self.max_buckets and now - last_seen < self.idle_seconds:
+                break
+            del self._buckets[key]
+
+
+def client_ip(request: Request) -> str:
+    if trust_forwarded_for:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+class RateLimit:
+    """FastAPI dependency limiting a route per client IP"""
+
+    def __init__(self, limiter: TokenBucketLimiter):
+        self.limiter = limiter
+
+    async def __call__(self, request: Request):
+        self.limiter.check(client_ip(request))
+
+
+contact_limiter = TokenBucketLimiter("contact", contact_rate_per_minute, contact_rate_burst)
+contact_email_limiter = TokenBucketLimiter("contact_email", contact_email_rate_per_minute, contact_email_rate_burst)
+write_limiter = TokenBucketLimiter("write", write_rate_per_minute, write_rate_burst)
+
+contact_rate_limit = RateLimit(contact_limiter)
+write_rate_limit = RateLimit(write_limiter)
+
+limiters = [contact_limiter, contact_email_limiter, write_limiter]
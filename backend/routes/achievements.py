@@ -1,65 +1,64 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List
 from models.Achievement import Achievement, AchievementCreate, AchievementUpdate
 from database import achievement_collection
+from codec import from_document, from_documents, to_document
+from cache import read_cache
+from coherency import content_changed
+from rate_limit import write_rate_limit
+from http_cache import last_write, versioned, conditional
 from datetime import datetime
+from pymongo import ReturnDocument
 
 router = APIRouter(prefix="/api/achievements", tags=["achievements"])
 
+async def get_active_achievements():
+    """Get active achievements in display order, served from the read cache"""
+    return await read_cache.get_or_load("achievements", "active", _fetch_active_achievements)
+
+async def _fetch_active_achievements():
+    achievements = await achievement_collection.find({"is_active": True}).sort("order", 1).to_list(1000)
+    return versioned(from_documents(Achievement, achievements), await last_write(achievement_collection))
+
 @router.get("/", response_model=List[Achievement])
-async def get_all_achievements():
+async def get_all_achievements(request: Request, response: Response):
     """Get all achievements"""
-    achievements = await achievement_collection.find({"is_active": True}).sort("order", 1).to_list(1000)
-    
-    # Convert MongoDB _id to id
-    for achievement in achievements:
-        achievement["id"] = str(achievement["_id"])
-        del achievement["_id"]
-    
-    return [Achievement(**achievement) for achievement in achievements]
+    return conditional(request, response, await get_active_achievements())
 
-@router.post("/", response_model=Achievement)
+@router.post("/", response_model=Achievement, dependencies=[Depends(write_rate_limit)])
 async def create_achievement(achievement: AchievementCreate):
     """Create new achievement"""
     achievement_obj = Achievement(**achievement.dict())
-    achievement_dict = achievement_obj.dict()
-    achievement_dict["_id"] = achievement_dict["id"]
-    del achievement_dict["id"]
-    
-    await achievement_collection.insert_one(achievement_dict)
+    await achievement_collection.insert_one(to_document(achievement_obj))
+    await content_changed("achievements")
     return achievement_obj
 
-@router.put("/{achievement_id}", response_model=Achievement)
+@router.put("/{achievement_id}", response_model=Achievement, dependencies=[Depends(write_rate_limit)])
 async def update_achievement(achievement_id: str, achievement_update: AchievementUpdate):
     """Update achievement"""
-    existing = await achievement_collection.find_one({"_id": achievement_id, "is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Achievement not found")
-    
     update_data = {k: v for k, v in achievement_update.dict().items() if v is not None}
     update_data["updated_at"] = datetime.utcnow()
     
-    await achievement_collection.update_one(
-        {"_id": achievement_id},
-        {"$set": update_data}
+    updated_achievement = await achievement_collection.find_one_and_update(
+        {"_id": achievement_id, "is_active": True},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
+    if not updated_achievement:
+        raise HTTPException(status_code=404, detail="Achievement not found")
+    await content_changed("achievements")
     
-    updated_achievement = await achievement_collection.find_one({"_id": achievement_id})
-    updated_achievement["id"] = str(updated_achievement["_id"])
-    del updated_achievement["_id"]
-    
-    return Achievement(**updated_achievement)
+    return from_document(Achievement, updated_achievement)
 
-@router.delete("/{achievement_id}")
+@router.delete("/{achievement_id}", dependencies=[Depends(write_rate_limit)])
 async def delete_achievement(achievement_id: str):
     """Delete achievement (soft delete)"""
-    existing = await achievement_collection.find_one({"_id": achievement_id, "is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Achievement not found")
-    
-    await achievement_collection.update_one(
-        {"_id": achievement_id},
+    result = await achievement_collection.update_one(
+        {"_id": achievement_id, "is_active": True},
         {"$set": {"is_active": False, "updated_at": datetime.utcnow()}}
     )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Achievement not found")
+    await content_changed("achievements")
     
     return {"message": "Achievement deleted successfully"}
\ No newline at end of file
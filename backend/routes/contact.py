@@ -1,43 +1,97 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
-from models.ContactMessage import ContactMessage, ContactMessageCreate
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from models.ContactMessage import ContactMessage, ContactMessageCreate, ContactMessagePage
 from database import contact_message_collection
+from codec import from_documents, to_document
+from rate_limit import contact_rate_limit, contact_email_limiter, write_rate_limit
+from write_behind import contact_write_buffer, BufferFull
+from datetime import datetime
+import asyncio
+import base64
+import json
 
 router = APIRouter(prefix="/api/contact", tags=["contact"])
 
-@router.post("/", response_model=ContactMessage)
+@router.post("/", response_model=ContactMessage, dependencies=[Depends(contact_rate_limit)])
 async def submit_contact_form(contact_message: ContactMessageCreate):
     """Submit contact form"""
+    contact_email_limiter.check(contact_message.email.strip().lower())
     contact_obj = ContactMessage(**contact_message.dict())
-    contact_dict = contact_obj.dict()
-    contact_dict["_id"] = contact_dict["id"]
-    del contact_dict["id"]
+    if contact_write_buffer is None:
+        await contact_message_collection.insert_one(to_document(contact_obj))
+        return contact_obj
     
-    await contact_message_collection.insert_one(contact_dict)
+    # Acknowledge right away, the buffer stores the message in a batch
+    try:
+        contact_write_buffer.submit(to_document(contact_obj))
+    except BufferFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many messages right now, please try again shortly",
+            headers={"Retry-After": "5"}
+        )
     return contact_obj
 
-@router.get("/messages", response_model=List[ContactMessage])
-async def get_all_contact_messages():
-    """Get all contact messages (admin only)"""
-    messages = await contact_message_collection.find().sort("created_at", -1).to_list(1000)
+def _encode_cursor(message: ContactMessage) -> str:
+    position = json.dumps([message.created_at.isoformat(), message.id])
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+def _decode_cursor(cursor: str):
+    try:
+        created_at, message_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), message_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+@router.get("/messages", response_model=ContactMessagePage)
+async def get_all_contact_messages(
+    after: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    is_read: Optional[bool] = None,
+    since: Optional[datetime] = Query(None, description="Only messages created at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only messages created before this time"),
+):
+    """Get contact messages newest first, one page at a time (admin only)"""
+    query = {}
+    if is_read is not None:
+        query["is_read"] = is_read
+    if since or until:
+        query["created_at"] = {}
+        if since:
+            query["created_at"]["$gte"] = since
+        if until:
+            query["created_at"]["$lt"] = until
     
-    # Convert MongoDB _id to id
-    for message in messages:
-        message["id"] = str(message["_id"])
-        del message["_id"]
+    page_query = query
+    if after:
+        created_at, message_id = _decode_cursor(after)
+        page_query = {"$and": [query, {"$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": message_id}},
+        ]}]}
+    
+    # Fetch one extra message to know whether there is a next page
+    messages, total, unread = await asyncio.gather(
+        contact_message_collection.find(page_query)
+            .sort([("created_at", -1), ("_id", -1)])
+            .limit(limit + 1)
+            .to_list(limit + 1),
+        contact_message_collection.count_documents(query),
+        contact_message_collection.count_documents({**query, "is_read": False}),
+    )
     
-    return [ContactMessage(**message) for message in messages]
+    messages = from_documents(ContactMessage, messages)
+    next_cursor = _encode_cursor(messages[limit - 1]) if len(messages) > limit else None
+    return ContactMessagePage(messages=messages[:limit], next_cursor=next_cursor, total=total, unread=unread)
 
-@router.put("/messages/{message_id}/read")
+@router.put("/messages/{message_id}/read", dependencies=[Depends(write_rate_limit)])
 async def mark_message_as_read(message_id: str):
     """Mark contact message as read"""
-    existing = await contact_message_collection.find_one({"_id": message_id})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Message not found")
-    
-    await contact_message_collection.update_one(
+    result = await contact_message_collection.update_one(
         {"_id": message_id},
         {"$set": {"is_read": True}}
     )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Message not found")
     
     return {"message": "Message marked as read"}
\ No newline at end of file
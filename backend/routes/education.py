@@ -1,65 +1,64 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List
 from models.Education import Education, EducationCreate, EducationUpdate
 from database import education_collection
+from codec import from_document, from_documents, to_document
+from cache import read_cache
+from coherency import content_changed
+from rate_limit import write_rate_limit
+from http_cache import last_write, versioned, conditional
 from datetime import datetime
+from pymongo import ReturnDocument
 
 router = APIRouter(prefix="/api/education", tags=["education"])
 
+async def get_active_education_entries():
+    """Get active education entries in display order, served from the read cache"""
+    return await read_cache.get_or_load("education", "active", _fetch_active_education_entries)
+
+async def _fetch_active_education_entries():
+    education_entries = await education_collection.find({"is_active": True}).sort("order", 1).to_list(1000)
+    return versioned(from_documents(Education, education_entries), await last_write(education_collection))
+
 @router.get("/", response_model=List[Education])
-async def get_all_education():
+async def get_all_education(request: Request, response: Response):
     """Get all education entries"""
-    education_entries = await education_collection.find({"is_active": True}).sort("order", 1).to_list(1000)
-    
-    # Convert MongoDB _id to id
-    for edu in education_entries:
-        edu["id"] = str(edu["_id"])
-        del edu["_id"]
-    
-    return [Education(**edu) for edu in education_entries]
+    return conditional(request, response, await get_active_education_entries())
 
-@router.post("/", response_model=Education)
+@router.post("/", response_model=Education, dependencies=[Depends(write_rate_limit)])
 async def create_education(education: EducationCreate):
     """Create new education entry"""
     education_obj = Education(**education.dict())
-    education_dict = education_obj.dict()
-    education_dict["_id"] = education_dict["id"]
-    del education_dict["id"]
-    
-    await education_collection.insert_one(education_dict)
+    await education_collection.insert_one(to_document(education_obj))
+    await content_changed("education")
     return education_obj
 
-@router.put("/{education_id}", response_model=Education)
+@router.put("/{education_id}", response_model=Education, dependencies=[Depends(write_rate_limit)])
 async def update_education(education_id: str, education_update: EducationUpdate):
     """Update education entry"""
-    existing = await education_collection.find_one({"_id": education_id, "is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Education entry not found")
-    
     update_data = {k: v for k, v in education_update.dict().items() if v is not None}
     update_data["updated_at"] = datetime.utcnow()
     
-    await education_collection.update_one(
-        {"_id": education_id},
-        {"$set": update_data}
+    updated_education = await education_collection.find_one_and_update(
+        {"_id": education_id, "is_active": True},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
+    if not updated_education:
+        raise HTTPException(status_code=404, detail="Education entry not found")
+    await content_changed("education")
     
-    updated_education = await education_collection.find_one({"_id": education_id})
-    updated_education["id"] = str(updated_education["_id"])
-    del updated_education["_id"]
-    
-    return Education(**updated_education)
+    return from_document(Education, updated_education)
 
-@router.delete("/{education_id}")
+@router.delete("/{education_id}", dependencies=[Depends(write_rate_limit)])
 async def delete_education(education_id: str):
     """Delete education entry (soft delete)"""
-    existing = await education_collection.find_one({"_id": education_id, "is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Education entry not found")
-    
-    await education_collection.update_one(
-        {"_id": education_id},
+    result = await education_collection.update_one(
+        {"_id": education_id, "is_active": True},
         {"$set": {"is_active": False, "updated_at": datetime.utcnow()}}
     )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Education entry not found")
+    await content_changed("education")
     
     return {"message": "Education entry deleted successfully"}
\ No newline at end of file
@@ -1,65 +1,96 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import List, Literal, Optional
 from models.Experience import Experience, ExperienceCreate, ExperienceUpdate
 from database import experience_collection
+from codec import from_document, from_documents, to_document
+from cache import read_cache
+from coherency import content_changed
+from rate_limit import write_rate_limit
+from search import search_index
+from facets import technology_index, TECHNOLOGY_COLLATION
+from http_cache import last_write, versioned, conditional
 from datetime import datetime
+from pymongo import ReturnDocument
 
 router = APIRouter(prefix="/api/experience", tags=["experience"])
 
-@router.get("/", response_model=List[Experience])
-async def get_all_experiences():
-    """Get all experience entries"""
+async def get_active_experiences():
+    """Get active experience entries in display order, served from the read cache"""
+    return await read_cache.get_or_load("experience", "active", _fetch_active_experiences)
+
+async def _fetch_active_experiences():
     experiences = await experience_collection.find({"is_active": True}).sort("order", 1).to_list(1000)
+    return versioned(from_documents(Experience, experiences), await last_write(experience_collection))
+
+async def get_experiences_by_technology(technologies: List[str], match_all: bool = True):
+    """Get active experiences using all (or any) of the technologies"""
+    # Not cached: this only filters the cached active list against in-memory sets,
+    # and caching it could serve results from a technology map that is mid-update
+    if technology_index.ready:
+        ids = technology_index.match("experience", technologies, match_all)
+        active = await get_active_experiences()
+        return versioned([experience for experience in active.content if experience.id in ids], active.last_modified)
     
-    # Convert MongoDB _id to id
-    for exp in experiences:
-        exp["id"] = str(exp["_id"])
-        del exp["_id"]
-    
-    return [Experience(**exp) for exp in experiences]
+    # Before the map is built, use the case-insensitive multikey index on technologies
+    experiences = await experience_collection.find(
+        {"technologies": {"$all" if match_all else "$in": technologies}, "is_active": True},
+        collation=TECHNOLOGY_COLLATION
+    ).sort("order", 1).to_list(1000)
+    return versioned(from_documents(Experience, experiences), await last_write(experience_collection))
 
-@router.post("/", response_model=Experience)
+@router.get("/", response_model=List[Experience])
+async def get_all_experiences(
+    request: Request,
+    response: Response,
+    technology: Optional[List[str]] = Query(None, description="Only entries using these technologies"),
+    match: Literal["all", "any"] = "all",
+):
+    """Get all experience entries"""
+    if technology:
+        return conditional(request, response, await get_experiences_by_technology(technology, match == "all"))
+    return conditional(request, response, await get_active_experiences())
+
+@router.post("/", response_model=Experience, dependencies=[Depends(write_rate_limit)])
 async def create_experience(experience: ExperienceCreate):
     """Create new experience entry"""
     experience_obj = Experience(**experience.dict())
-    experience_dict = experience_obj.dict()
-    experience_dict["_id"] = experience_dict["id"]
-    del experience_dict["id"]
-    
-    await experience_collection.insert_one(experience_dict)
+    await experience_collection.insert_one(to_document(experience_obj))
+    await content_changed("experience")
+    search_index.add("experience", experience_obj)
+    technology_index.add("experience", experience_obj)
     return experience_obj
 
-@router.put("/{experience_id}", response_model=Experience)
+@router.put("/{experience_id}", response_model=Experience, dependencies=[Depends(write_rate_limit)])
 async def update_experience(experience_id: str, experience_update: ExperienceUpdate):
     """Update experience entry"""
-    existing = await experience_collection.find_one({"_id": experience_id, "is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Experience not found")
-    
     update_data = {k: v for k, v in experience_update.dict().items() if v is not None}
     update_data["updated_at"] = datetime.utcnow()
     
-    await experience_collection.update_one(
-        {"_id": experience_id},
-        {"$set": update_data}
+    updated_exp = await experience_collection.find_one_and_update(
+        {"_id": experience_id, "is_active": True},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
+    if not updated_exp:
+        raise HTTPException(status_code=404, detail="Experience not found")
+    await content_changed("experience")
     
-    updated_exp = await experience_collection.find_one({"_id": experience_id})
-    updated_exp["id"] = str(updated_exp["_id"])
-    del updated_exp["_id"]
-    
-    return Experience(**updated_exp)
+    experience_obj = from_document(Experience, updated_exp)
+    search_index.add("experience", experience_obj)
+    technology_index.add("experience", experience_obj)
+    return experience_obj
 
-@router.delete("/{experience_id}")
+@router.delete("/{experience_id}", dependencies=[Depends(write_rate_limit)])
 async def delete_experience(experience_id: str):
     """Delete experience entry (soft delete)"""
-    existing = await experience_collection.find_one({"_id": experience_id, "is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Experience not found")
-    
-    await experience_collection.update_one(
-        {"_id": experience_id},
+    result = await experience_collection.update_one(
+        {"_id": experience_id, "is_active": True},
         {"$set": {"is_active": False, "updated_at": datetime.utcnow()}}
     )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Experience not found")
+    await content_changed("experience")
+    search_index.remove("experience", experience_id)
+    technology_index.remove("experience", experience_id)
     
     return {"message": "Experience deleted successfully"}
\ No newline at end of file
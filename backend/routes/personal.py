@@ -1,25 +1,38 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List
 from models.PersonalInfo import PersonalInfo, PersonalInfoCreate, PersonalInfoUpdate
 from database import personal_info_collection
+from codec import from_document, to_document
+from cache import read_cache
+from coherency import content_changed
+from rate_limit import write_rate_limit
+from http_cache import last_write, versioned, conditional
 from datetime import datetime
+from pymongo import ReturnDocument
 
 router = APIRouter(prefix="/api/personal", tags=["personal"])
 
-@router.get("/", response_model=PersonalInfo)
-async def get_personal_info():
-    """Get personal information"""
+async def get_active_personal_info():
+    """Get the active personal information, served from the read cache"""
+    return await read_cache.get_or_load("personal_info", "active", _fetch_active_personal_info)
+
+async def _fetch_active_personal_info():
     personal_info = await personal_info_collection.find_one({"is_active": True})
     if not personal_info:
-        raise HTTPException(status_code=404, detail="Personal information not found")
+        return versioned(None)
     
-    # Convert MongoDB _id to id
-    personal_info["id"] = str(personal_info["_id"])
-    del personal_info["_id"]
+    return versioned(from_document(PersonalInfo, personal_info), await last_write(personal_info_collection))
+
+@router.get("/", response_model=PersonalInfo)
+async def get_personal_info(request: Request, response: Response):
+    """Get personal information"""
+    personal_info = await get_active_personal_info()
+    if not personal_info.content:
+        raise HTTPException(status_code=404, detail="Personal information not found")
     
-    return PersonalInfo(**personal_info)
+    return conditional(request, response, personal_info)
 
-@router.post("/", response_model=PersonalInfo)
+@router.post("/", response_model=PersonalInfo, dependencies=[Depends(write_rate_limit)])
 async def create_personal_info(personal_info: PersonalInfoCreate):
     """Create personal information (if not exists)"""
     # Check if personal info already exists
@@ -28,30 +41,23 @@ async def create_personal_info(personal_info: PersonalInfoCreate):
         raise HTTPException(status_code=400, detail="Personal information already exists. Use PUT to update.")
     
     personal_info_obj = PersonalInfo(**personal_info.dict())
-    personal_info_dict = personal_info_obj.dict()
-    personal_info_dict["_id"] = personal_info_dict["id"]
-    del personal_info_dict["id"]
-    
-    await personal_info_collection.insert_one(personal_info_dict)
+    await personal_info_collection.insert_one(to_document(personal_info_obj))
+    await content_changed("personal_info")
     return personal_info_obj
 
-@router.put("/", response_model=PersonalInfo)
+@router.put("/", response_model=PersonalInfo, dependencies=[Depends(write_rate_limit)])
 async def update_personal_info(personal_info_update: PersonalInfoUpdate):
     """Update personal information"""
-    existing = await personal_info_collection.find_one({"is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Personal information not found")
-    
     update_data = {k: v for k, v in personal_info_update.dict().items() if v is not None}
     update_data["updated_at"] = datetime.utcnow()
     
-    await personal_info_collection.update_one(
-        {"_id": existing["_id"]},
-        {"$set": update_data}
+    updated_info = await personal_info_collection.find_one_and_update(
+        {"is_active": True},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
+    if not updated_info:
+        raise HTTPException(status_code=404, detail="Personal information not found")
+    await content_changed("personal_info")
     
-    updated_info = await personal_info_collection.find_one({"_id": existing["_id"]})
-    updated_info["id"] = str(updated_info["_id"])
-    del updated_info["_id"]
-    
-    return PersonalInfo(**updated_info)
\ No newline at end of file
+    return from_document(PersonalInfo, updated_info)
\ No newline at end of file
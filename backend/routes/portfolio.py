@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Request, Response
+import asyncio
+from models.Portfolio import Portfolio
+from http_cache import combine, conditional
+from routes.personal import get_active_personal_info
+from routes.experience import get_active_experiences
+from routes.projects import get_active_projects
+from routes.skills import get_active_skills
+from routes.achievements import get_active_achievements
+from routes.education import get_active_education_entries
+
+router = APIRouter(prefix="/api/portfolio", tags=["portfolio"])
+
+# Last combined snapshot, reused while none of its parts changed
+_snapshot = None
+
+async def get_portfolio_resource():
+    """Get the combined portfolio, rebuilt only when one of its parts changed"""
+    global _snapshot
+    parts = await asyncio.gather(
+        get_active_personal_info(),
+        get_active_experiences(),
+        get_active_projects(),
+        get_active_skills(),
+        get_active_achievements(),
+        get_active_education_entries(),
+    )
+
+    etags = [part.etag for part in parts]
+    if _snapshot is None or _snapshot[0] != etags:
+        _snapshot = (etags, _build_snapshot(*parts))
+    return _snapshot[1]
+
+@router.get("/", response_model=Portfolio)
+async def get_portfolio(request: Request, response: Response):
+    """Get the whole portfolio in a single response"""
+    return conditional(request, response, await get_portfolio_resource())
+
+def _build_snapshot(personal_info, experiences, projects, skills, achievements, education):
+    portfolio = Portfolio(
+        personal_info=personal_info.content,
+        experience=experiences.content,
+        projects=projects.content,
+        skills=skills.content,
+        achievements=achievements.content,
+        education=education.content,
+    )
+    return combine(portfolio, personal_info, experiences, projects, skills, achievements, education)
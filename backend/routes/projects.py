@@ -1,77 +1,127 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
-from models.Project import Project, ProjectCreate, ProjectUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import List, Literal, Optional
+from models.Project import Project, ProjectCategory, ProjectCreate, ProjectUpdate
 from database import project_collection
+from codec import from_document, from_documents, to_document
+from cache import read_cache
+from coherency import content_changed
+from rate_limit import write_rate_limit
+from search import search_index
+from facets import technology_index, TECHNOLOGY_COLLATION
+from http_cache import aggregated, last_write, versioned, conditional
 from datetime import datetime
+from pymongo import ReturnDocument
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
+async def get_active_projects(category: Optional[str] = None):
+    """Get active projects in display order, served from the read cache"""
+    if category is None:
+        return await read_cache.get_or_load("projects", "active", lambda: _fetch_active_projects({}))
+    return await read_cache.get_or_load(
+        "projects", f"category:{category}", lambda: _fetch_active_projects({"category": category})
+    )
+
+async def _fetch_active_projects(query: dict):
+    projects = await project_collection.find({**query, "is_active": True}).sort("order", 1).to_list(1000)
+    return versioned(from_documents(Project, projects), await last_write(project_collection))
+
+async def get_project_categories():
+    """Get the categories of the active projects with their counts, served from the read cache"""
+    return await read_cache.get_or_load("projects", "categories", _fetch_project_categories)
+
+async def _fetch_project_categories():
+    rows = await project_collection.aggregate([
+        {"$match": {"is_active": True}},
+        {"$group": {
+            "_id": "$category",
+            "count": {"$sum": 1},
+            "order": {"$min": "$order"},
+        }},
+        {"$sort": {"order": 1, "_id": 1}},
+    ]).to_list(None)
+    categories = [ProjectCategory(name=row["_id"], count=row["count"], order=row["order"]) for row in rows]
+    return aggregated(categories, rows, await last_write(project_collection))
+
+async def get_projects_by_technology(technologies: List[str], match_all: bool = True):
+    """Get active projects using all (or any) of the technologies"""
+    # Not cached: this only filters the cached active list against in-memory sets,
+    # and caching it could serve results from a technology map that is mid-update
+    if technology_index.ready:
+        ids = technology_index.match("project", technologies, match_all)
+        active = await get_active_projects()
+        return versioned([project for project in active.content if project.id in ids], active.last_modified)
+    
+    # Before the map is built, use the case-insensitive multikey index on technologies
+    projects = await project_collection.find(
+        {"technologies": {"$all" if match_all else "$in": technologies}, "is_active": True},
+        collation=TECHNOLOGY_COLLATION
+    ).sort("order", 1).to_list(1000)
+    return versioned(from_documents(Project, projects), await last_write(project_collection))
+
 @router.get("/", response_model=List[Project])
-async def get_all_projects():
+async def get_all_projects(
+    request: Request,
+    response: Response,
+    technology: Optional[List[str]] = Query(None, description="Only projects using these technologies"),
+    match: Literal["all", "any"] = "all",
+):
     """Get all projects"""
-    projects = await project_collection.find({"is_active": True}).sort("order", 1).to_list(1000)
-    
-    # Convert MongoDB _id to id
-    for project in projects:
-        project["id"] = str(project["_id"])
-        del project["_id"]
-    
-    return [Project(**project) for project in projects]
+    if technology:
+        return conditional(request, response, await get_projects_by_technology(technology, match == "all"))
+    return conditional(request, response, await get_active_projects())
+
+@router.get("/categories", response_model=List[ProjectCategory])
+async def get_categories(request: Request, response: Response):
+    """Get project categories with their project counts"""
+    return conditional(request, response, await get_project_categories())
 
 @router.get("/category/{category}", response_model=List[Project])
-async def get_projects_by_category(category: str):
+async def get_projects_by_category(category: str, request: Request, response: Response):
     """Get projects by category"""
-    projects = await project_collection.find({"category": category, "is_active": True}).sort("order", 1).to_list(1000)
-    
-    # Convert MongoDB _id to id
-    for project in projects:
-        project["id"] = str(project["_id"])
-        del project["_id"]
-    
-    return [Project(**project) for project in projects]
+    return conditional(request, response, await get_active_projects(category))
 
-@router.post("/", response_model=Project)
+@router.post("/", response_model=Project, dependencies=[Depends(write_rate_limit)])
 async def create_project(project: ProjectCreate):
     """Create new project"""
     project_obj = Project(**project.dict())
-    project_dict = project_obj.dict()
-    project_dict["_id"] = project_dict["id"]
-    del project_dict["id"]
-    
-    await project_collection.insert_one(project_dict)
+    await project_collection.insert_one(to_document(project_obj))
+    await content_changed("projects")
+    search_index.add("project", project_obj)
+    technology_index.add("project", project_obj)
     return project_obj
 
-@router.put("/{project_id}", response_model=Project)
+@router.put("/{project_id}", response_model=Project, dependencies=[Depends(write_rate_limit)])
 async def update_project(project_id: str, project_update: ProjectUpdate):
     """Update project"""
-    existing = await project_collection.find_one({"_id": project_id, "is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
     update_data = {k: v for k, v in project_update.dict().items() if v is not None}
     update_data["updated_at"] = datetime.utcnow()
     
-    await project_collection.update_one(
-        {"_id": project_id},
-        {"$set": update_data}
+    updated_project = await project_collection.find_one_and_update(
+        {"_id": project_id, "is_active": True},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
+    if not updated_project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    await content_changed("projects")
     
-    updated_project = await project_collection.find_one({"_id": project_id})
-    updated_project["id"] = str(updated_project["_id"])
-    del updated_project["_id"]
-    
-    return Project(**updated_project)
+    project_obj = from_document(Project, updated_project)
+    search_index.add("project", project_obj)
+    technology_index.add("project", project_obj)
+    return project_obj
 
-@router.delete("/{project_id}")
+@router.delete("/{project_id}", dependencies=[Depends(write_rate_limit)])
 async def delete_project(project_id: str):
     """Delete project (soft delete)"""
-    existing = await project_collection.find_one({"_id": project_id, "is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    await project_collection.update_one(
-        {"_id": project_id},
+    result = await project_collection.update_one(
+        {"_id": project_id, "is_active": True},
         {"$set": {"is_active": False, "updated_at": datetime.utcnow()}}
     )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Project not found")
+    await content_changed("projects")
+    search_index.remove("project", project_id)
+    technology_index.remove("project", project_id)
     
     return {"message": "Project deleted successfully"}
\ No newline at end of file
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Query
+from typing import Literal, Optional
+from models.Search import SearchResults
+from search import search_index
+
+router = APIRouter(prefix="/api/search", tags=["search"])
+
+@router.get("/", response_model=SearchResults)
+async def search_portfolio(
+    q: str = Query(..., min_length=1, max_length=200),
+    type: Optional[Literal["project", "experience", "skill"]] = None,
+    limit: int = Query(10, ge=1, le=50),
+):
+    """Search projects, experience and skills"""
+    total, hits = search_index.search(q, limit=limit, kind=type)
+    return SearchResults(query=q, total=total, hits=hits)
@@ -1,65 +1,69 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List
 from models.Skill import Skill, SkillCreate, SkillUpdate
 from database import skill_collection
+from codec import from_document, from_documents, to_document
+from cache import read_cache
+from coherency import content_changed
+from rate_limit import write_rate_limit
+from search import search_index
+from http_cache import last_write, versioned, conditional
 from datetime import datetime
+from pymongo import ReturnDocument
 
 router = APIRouter(prefix="/api/skills", tags=["skills"])
 
+async def get_active_skills():
+    """Get active skill categories in display order, served from the read cache"""
+    return await read_cache.get_or_load("skills", "active", _fetch_active_skills)
+
+async def _fetch_active_skills():
+    skills = await skill_collection.find({"is_active": True}).sort("order", 1).to_list(1000)
+    return versioned(from_documents(Skill, skills), await last_write(skill_collection))
+
 @router.get("/", response_model=List[Skill])
-async def get_all_skills():
+async def get_all_skills(request: Request, response: Response):
     """Get all skills by categories."""
-    skills = await skill_collection.find({"is_active": True}).sort("order", 1).to_list(1000)
-    
-    # Convert MongoDB _id to id
-    for skill in skills:
-        skill["id"] = str(skill["_id"])
-        del skill["_id"]
-    
-    return [Skill(**skill) for skill in skills]
+    return conditional(request, response, await get_active_skills())
 
-@router.post("/", response_model=Skill)
+@router.post("/", response_model=Skill, dependencies=[Depends(write_rate_limit)])
 async def create_skill_category(skill: SkillCreate):
     """Create new skill category"""
     skill_obj = Skill(**skill.dict())
-    skill_dict = skill_obj.dict()
-    skill_dict["_id"] = skill_dict["id"]
-    del skill_dict["id"]
-    
-    await skill_collection.insert_one(skill_dict)
+    await skill_collection.insert_one(to_document(skill_obj))
+    await content_changed("skills")
+    search_index.add("skill", skill_obj)
     return skill_obj
 
-@router.put("/{skill_id}", response_model=Skill)
+@router.put("/{skill_id}", response_model=Skill, dependencies=[Depends(write_rate_limit)])
 async def update_skill_category(skill_id: str, skill_update: SkillUpdate):
     """Update skill category"""
-    existing = await skill_collection.find_one({"_id": skill_id, "is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Skill category not found")
-    
     update_data = {k: v for k, v in skill_update.dict().items() if v is not None}
     update_data["updated_at"] = datetime.utcnow()
     
-    await skill_collection.update_one(
-        {"_id": skill_id},
-        {"$set": update_data}
+    updated_skill = await skill_collection.find_one_and_update(
+        {"_id": skill_id, "is_active": True},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
+    if not updated_skill:
+        raise HTTPException(status_code=404, detail="Skill category not found")
+    await content_changed("skills")
     
-    updated_skill = await skill_collection.find_one({"_id": skill_id})
-    updated_skill["id"] = str(updated_skill["_id"])
-    del updated_skill["_id"]
-    
-    return Skill(**updated_skill)
+    skill_obj = from_document(Skill, updated_skill)
+    search_index.add("skill", skill_obj)
+    return skill_obj
 
-@router.delete("/{skill_id}")
+@router.delete("/{skill_id}", dependencies=[Depends(write_rate_limit)])
 async def delete_skill_category(skill_id: str):
     """Delete skill category (soft delete)"""
-    existing = await skill_collection.find_one({"_id": skill_id, "is_active": True})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Skill category not found")
-    
-    await skill_collection.update_one(
-        {"_id": skill_id},
+    result = await skill_collection.update_one(
+        {"_id": skill_id, "is_active": True},
         {"$set": {"is_active": False, "updated_at": datetime.utcnow()}}
     )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Skill category not found")
+    await content_changed("skills")
+    search_index.remove("skill", skill_id)
     
     return {"message": "Skill category deleted successfully"}
\ No newline at end of file
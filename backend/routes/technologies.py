@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from typing import List
+from models.Technology import TechnologyFacet
+from facets import technology_index, build_technology_index
+
+router = APIRouter(prefix="/api/technologies", tags=["technologies"])
+
+@router.get("/", response_model=List[TechnologyFacet])
+async def get_technologies():
+    """Get every technology with its project and experience counts"""
+    if not technology_index.ready:
+        await build_technology_index()
+    return technology_index.facets()
\ No newline at end of file
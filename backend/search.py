@@ -0,0 +1,151 @@
+import bisect
+import math
+import re
+from collections import defaultdict
+from cache import read_cache
+
+# In-memory inverted index over projects, experience and skills.
+#
+# Each indexed field has a weight that multiplies its term frequencies, and
+# hits are ranked with BM25. Query terms also match indexed terms they are a
+# prefix of, at a discount, so "reac" finds "react".
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+# Kind -> (field -> weight, function building the hit title)
+INDEXED_FIELDS = {
+    "project": (
+        {"title": 3.0, "technologies": 2.0, "description": 1.5, "long_description": 1.0, "features": 1.0},
+        lambda project: project.title,
+    ),
+    "experience": (
+        {"position": 2.0, "company": 2.0, "technologies": 2.0, "responsibilities": 1.0},
+        lambda experience: f"{experience.position} at {experience.company}",
+    ),
+    "skill": (
+        {"category": 2.0, "skills": 2.0},
+        lambda skill: skill.category,
+    ),
+}
+
+K1 = 1.2
+B = 0.75
+PREFIX_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 50
+
+
+def tokenize(text: str):
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex:
+    def __init__(self):
+        self._postings = defaultdict(dict)
+        self._terms = []
+        self._lengths = {}
+        self._titles = {}
+        self._doc_terms = {}
+        self._total_length = 0.0
+
+    def __len__(self):
+        return len(self._lengths)
+
+    def add(self, kind: str, model):
+        """Index a model, replacing any earlier version of it"""
+        fields, title = INDEXED_FIELDS[kind]
+        key = (kind, model.id)
+        self.remove(kind, model.id)
+
+        frequencies = defaultdict(float)
+        for field, weight in fields.items():
+            value = getattr(model, field, None) or ""
+            text = " ".join(value) if isinstance(value, list) else value
+            for token in tokenize(text):
+                frequencies[token] += weight
+
+        for term, frequency in frequencies.items():
+            postings = self._postings[term]
+            if not postings:
+                bisect.insort(self._terms, term)
+            postings[key] = frequency
+
+        length = sum(frequencies.values())
+        self._lengths[key] = length
+        self._total_length += length
+        self._titles[key] = title(model)
+        self._doc_terms[key] = list(frequencies)
+
+    def remove(self, kind: str, model_id: str):
+        key = (kind, model_id)
+        if key not in self._lengths:
+            return
+
+        for term in self._doc_terms.pop(key):
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect.bisect_left(self._terms, term)]
+
+        self._total_length -= self._lengths.pop(key)
+        del self._titles[key]
+
+    def clear(self):
+        self.__init__()
+
+    def _expand(self, token: str):
+        """Yield (term, weight) for the token and the terms it is a prefix of"""
+        start = bisect.bisect_left(self._terms, token)
+        for term in self._terms[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(token):
+                break
+            yield term, 1.0 if term == token else PREFIX_WEIGHT
+
+    def search(self, query: str, limit: int = 10, kind: str = None):
+        """Return ``(total, hits)`` ranked by BM25 score"""
+        count = len(self._lengths)
+        if not count:
+            return 0, []
+        average_length = self._total_length / count
+
+        scores = defaultdict(float)
+        for token in set(tokenize(query)):
+            for term, weight in self._expand(token):
+                postings = self._postings[term]
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, frequency in postings.items():
+                    if kind and key[0] != kind:
+                        continue
+                    norm = K1 * (1 - B + B * self._lengths[key] / average_length)
+                    scores[key] += weight * idf * frequency * (K1 + 1) / (frequency + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        hits = [
+            {"type": key[0], "id": key[1], "title": self._titles[key], "score": round(score, 4)}
+            for key, score in ranked[:limit]
+        ]
+        return len(ranked), hits
+
+
+search_index = SearchIndex()
+
+
+async def build_search_index():
+    """(Re)build the index from the active projects, experience and skills"""
+    from routes.projects import get_active_projects
+    from routes.experience import get_active_experiences
+    from routes.skills import get_active_skills
+
+    # A local write during the load updates the live index, which the swap
+    # would throw away, so load again until no write got in between
+    while True:
+        generations = [read_cache.generation(name) for name in ("projects", "experience", "skills")]
+        index = SearchIndex()
+        for kind, getter in (("project", get_active_projects), ("experience", get_active_experiences), ("skill", get_active_skills)):
+            for model in (await getter()).content:
+                index.add(kind, model)
+        if [read_cache.generation(name) for name in ("projects", "experience", "skills")] == generations:
+            break
+
+    # Swap in one step so concurrent searches never see a half-built index
+    search_index.__dict__.update(index.__dict__)
@@ -1,4 +1,5 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Depends
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import os
@@ -6,14 +7,36 @@ import logging
 from pathlib import Path
 
 # Import route modules
-from routes import personal, experience, projects, skills, achievements, education, contact
-from database import close_db_connection
+from routes import personal, experience, projects, skills, achievements, education, contact, portfolio, search, technologies
+from database import db, close_db_connection
+from indexes import ensure_indexes
+from write_behind import contact_write_buffer
+from rate_limit import limiters
+from search import build_search_index
+from facets import build_technology_index
+from coherency import generation_watcher
+from concurrency import ConcurrencyLimitMiddleware, concurrency_limiter, concurrency_limit_enabled
+from metrics import MetricsMiddleware, metrics_enabled, registry
+from tracing import ServerTimingMiddleware, handler_started, tracing_enabled
+from profiling import ProfilingMiddleware, profile_enabled
+from slow_queries import slow_query_log
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # Create the main app
-app = FastAPI(title="Portfolio API", description="API for Shreya's Portfolio Website", version="1.0.0")
+app = FastAPI(
+    title="Portfolio API",
+    description="API for Shreya's Portfolio Website",
+    version="1.0.0",
+    dependencies=[Depends(handler_started)],
+)
+
+# Shed load once too many requests are in flight (inside CORS so 503s keep CORS headers)
+if concurrency_limit_enabled:
+    app.add_middleware(
+        ConcurrencyLimitMiddleware, limiter=concurrency_limiter, exempt_paths=("/health", "/metrics")
+    )
 
 # Add CORS middleware
 app.add_middleware(
@@ -24,6 +47,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request spans as a Server-Timing header, including time queued by the limiter
+if tracing_enabled:
+    app.add_middleware(ServerTimingMiddleware)
+
+# Outermost, so the latency includes every other middleware and shed requests
+if metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+# Opt-in request profiler, outside everything else so profiles cover the whole stack
+if profile_enabled:
+    app.add_middleware(ProfilingMiddleware)
+
 # Create a router with the /api prefix for the root endpoint
 api_router = APIRouter(prefix="/api")
 
@@ -39,6 +74,9 @@ app.include_router(skills.router)
 app.include_router(achievements.router)
 app.include_router(education.router)
 app.include_router(contact.router)
+app.include_router(portfolio.router)
+app.include_router(search.router)
+app.include_router(technologies.router)
 
 # Include the root router
 app.include_router(api_router)
@@ -50,19 +88,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rebuild the in-memory indexes when another worker changes their content
+generation_watcher.subscribe(("projects", "experience", "skills"), build_search_index)
+generation_watcher.subscribe(("projects", "experience"), build_technology_index)
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("Portfolio API is starting up...")
+    slow_query_log.start(db)
+    try:
+        await ensure_indexes()
+    except Exception:
+        logger.exception("Could not create MongoDB indexes")
+    try:
+        # Record the content generations before anything is cached
+        await generation_watcher.poll()
+    except Exception:
+        logger.exception("Could not read the content generations")
+    try:
+        await build_search_index()
+    except Exception:
+        logger.exception("Could not build the search index")
+    try:
+        await build_technology_index()
+    except Exception:
+        logger.exception("Could not build the technology index")
+    generation_watcher.start()
+    if contact_write_buffer is not None:
+        contact_write_buffer.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Portfolio API is shutting down...")
+    await generation_watcher.stop()
+    await slow_query_log.stop()
+    if contact_write_buffer is not None:
+        await contact_write_buffer.stop()
     await close_db_connection()
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "portfolio-api"}
+    return {
+        "status": "healthy",
+        "service": "portfolio-api",
+        "rate_limits": {limiter.name: limiter.stats() for limiter in limiters},
+        "concurrency": concurrency_limiter.stats(),
+        "cache_generations": generation_watcher.stats(),
+    }
+
+if metrics_enabled:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,222 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from dotenv import load_dotenv
+from pymongo import monitoring
+
+load_dotenv()
+
+logger = logging.getLogger("slow_queries")
+
+# Slow query log. Every MongoDB command slower than SLOW_QUERY_MS is logged
+# with its collection, redacted filter shape, sort, duration and the number
+# of documents returned. The first time a worker sees a slow shape it also
+# stores the query plan in the slow_queries collection, one document per
+# shape with occurrence counts, so the log doubles as an audit over time.
+
+slow_query_ms = float(os.environ.get('SLOW_QUERY_MS', '100'))  # 0 disables the log
+slow_query_explain = os.environ.get('SLOW_QUERY_EXPLAIN', 'true').lower() in ('1', 'true', 'yes')
+
+SLOW_QUERY_COLLECTION = "slow_queries"
+
+# Command -> field holding its filter (aggregate keeps its pipeline)
+FILTER_FIELDS = {
+    "find": "filter",
+    "aggregate": "pipeline",
+    "count": "query",
+    "distinct": "query",
+    "findAndModify": "query",
+    "update": "updates",
+    "delete": "deletes",
+}
+
+# Connection and session fields that explain does not accept
+_DRIVER_FIELDS = {"lsid", "txnNumber", "autocommit", "startTransaction", "readConcern", "writeConcern"}
+
+
+def redact(value):
+    """Replace every literal with ``"?"``, keeping field names and operators"""
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, list):
+        shapes = []
+        for item in map(redact, value):
+            if item not in shapes:
+                shapes.append(item)
+        return shapes
+    return "?"
+
+
+def command_shape(command_name: str, command: dict) -> dict:
+    field = FILTER_FIELDS[command_name]
+    if command_name in ("update", "delete"):
+        # Write commands carry a list of statements, each with a filter under "q"
+        filters = redact([statement.get("q", {}) for statement in command.get(field, [])])
+        return {"filter": filters[0] if len(filters) == 1 else filters}
+
+    shape = {field: redact(command.get(field, {}))}
+    if command.get("sort"):
+        # Sort directions are part of the shape, not data
+        shape["sort"] = command["sort"]
+    return shape
+
+
+def documents_returned(command_name: str, reply: dict):
+    cursor = reply.get("cursor")
+    if cursor is not None:
+        return len(cursor.get("firstBatch", ()))
+    if command_name == "findAndModify":
+        return 0 if reply.get("value") is None else 1
+    if command_name == "distinct":
+        return len(reply.get("values", ()))
+    return reply.get("n")
+
+
+class SlowQueryLog(monitoring.CommandListener):
+    """Command listener logging slow commands and explaining new shapes.
+
+    The listener runs on Motor's executor threads, so it only hands slow
+    commands over to a task on the event loop, which logs them and talks to
+    MongoDB.
+    """
+
+    def __init__(self, threshold_ms: float, explain: bool, max_pending: int = 1000):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.max_pending = max_pending
+        self._commands = {}
+        self._explained = set()
+        self._loop = None
+        self._queue = None
+        self._task = None
+        self._db = None
+        self.logged = 0
+        self.dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def start(self, db):
+        """Start handing slow commands to a task on the running loop"""
+        if not self.enabled or self._task is not None:
+            return
+        self._db = db
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._loop = None
+
+    def started(self, event):
+        if self._loop is None or event.command_name not in FILTER_FIELDS:
+            return
+        collection = event.command.get(event.command_name)
+        if collection == SLOW_QUERY_COLLECTION:
+            return
+        self._commands[(event.connection_id, event.request_id)] = (collection, event.command)
+
+    def succeeded(self, event):
+        started = self._commands.pop((event.connection_id, event.request_id), None)
+        if started is None or event.duration_micros / 1_000_000 < self.threshold:
+            return
+        self._hand_over(started, event, documents_returned(event.command_name, event.reply))
+
+    def failed(self, event):
+        started = self._commands.pop((event.connection_id, event.request_id), None)
+        if started is None or event.duration_micros / 1_000_000 < self.threshold:
+            return
+        self._hand_over(started, event, None)
+
+    def _hand_over(self, started, event, documents):
+        collection, command = started
+        entry = {
+            "collection": collection,
+            "command": event.command_name,
+            "shape": command_shape(event.command_name, command),
+            "duration_ms": round(event.duration_micros / 1000, 1),
+            "documents": documents,
+            "full_command": command,
+        }
+        try:
+            self._loop.call_soon_threadsafe(self._enqueue, entry)
+        except RuntimeError:
+            # The loop closed while the command was running
+            pass
+
+    def _enqueue(self, entry):
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def _run(self):
+        while True:
+            entry = await self._queue.get()
+            try:
+                await self._record(entry)
+            except Exception:
+                logger.exception("Could not record a slow %s on %s", entry["command"], entry["collection"])
+
+    async def _record(self, entry):
+        command = entry.pop("full_command")
+        # Shapes and plans hold operator names, which cannot be stored as field names
+        shape = json.dumps(entry["shape"], sort_keys=True, default=str)
+        self.logged += 1
+        logger.warning(
+            "Slow %s on %s: %.1f ms, %s documents, shape %s",
+            entry["command"], entry["collection"], entry["duration_ms"], entry["documents"], shape,
+        )
+
+        shape_id = hashlib.sha1(f"{entry['collection']}:{entry['command']}:{shape}".encode()).hexdigest()
+        now = datetime.utcnow()
+        update = {
+            "$setOnInsert": {
+                "collection": entry["collection"],
+                "command": entry["command"],
+                "shape": shape,
+                "first_seen": now,
+            },
+            "$set": {"last_seen": now, "last_documents": entry["documents"]},
+            "$inc": {"count": 1},
+            "$max": {"max_ms": entry["duration_ms"]},
+        }
+        if self.explain and shape_id not in self._explained:
+            self._explained.add(shape_id)
+            plan = await self._explain(command)
+            logger.warning("Plan of the slow %s on %s: %s", entry["command"], entry["collection"], plan["stages"])
+            update["$set"].update(plan, explained_at=now)
+
+        await self._db[SLOW_QUERY_COLLECTION].update_one({"_id": shape_id}, update, upsert=True)
+
+    async def _explain(self, command: dict) -> dict:
+        """The winning plan's stages and the full query planner output"""
+        from indexes import plan_stages
+
+        explainable = {
+            key: value for key, value in command.items()
+            if not key.startswith("$") and key not in _DRIVER_FIELDS
+        }
+        try:
+            explanation = await self._db.command({"explain": explainable, "verbosity": "queryPlanner"})
+        except Exception as error:
+            return {"stages": f"explain failed: {error}", "plan": None}
+
+        planner = explanation.get("queryPlanner") or explanation.get("stages", [{}])[0].get("$cursor", {}).get("queryPlanner", {})
+        stages = " <- ".join(stage for stage in plan_stages(planner.get("winningPlan", {})) if stage)
+        return {"stages": stages, "plan": json.dumps(explanation, default=str)}
+
+
+slow_query_log = SlowQueryLog(slow_query_ms, slow_query_explain)
@@ -0,0 +1,191 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote
+
+from http_cache import Resource, ENCODINGS, aggregated, brotli, compress, encoded_response
+
+# Static snapshots of the public read endpoints.
+#
+#   python snapshot.py export   renders every public GET endpoint from MongoDB
+#                               into snapshots/<version>/ and points
+#                               snapshots/CURRENT at it
+#   python snapshot.py serve    serves the current snapshot without MongoDB
+#
+# Each endpoint is stored as raw JSON plus its gzip/Brotli encodings, and the
+# manifest keeps the ETag and Last-Modified so revalidation keeps working.
+
+DEFAULT_SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+MANIFEST = "manifest.json"
+CURRENT = "CURRENT"
+
+
+async def render_endpoints() -> dict:
+    """Render every public GET endpoint to a resource, keyed by URL path"""
+    # Imported here so serving a snapshot never needs the database settings
+    from routes.personal import get_active_personal_info
+    from routes.experience import get_active_experiences
+    from routes.projects import get_active_projects, get_project_categories
+    from routes.skills import get_active_skills
+    from routes.achievements import get_active_achievements
+    from routes.education import get_active_education_entries
+    from routes.portfolio import get_portfolio_resource
+    from routes.technologies import get_technologies
+
+    resources = {
+        "/api/experience/": await get_active_experiences(),
+        "/api/projects/": await get_active_projects(),
+        "/api/projects/categories": await get_project_categories(),
+        "/api/skills/": await get_active_skills(),
+        "/api/achievements/": await get_active_achievements(),
+        "/api/education/": await get_active_education_entries(),
+        "/api/portfolio/": await get_portfolio_resource(),
+    }
+
+    personal_info = await get_active_personal_info()
+    if personal_info.content is not None:
+        resources["/api/personal/"] = personal_info
+
+    # The facets are derived from the active projects and experience
+    facets = await get_technologies()
+    sources = (resources["/api/projects/"], resources["/api/experience/"])
+    last_modified = max((r.last_modified for r in sources if r.last_modified), default=None)
+    resources["/api/technologies/"] = aggregated(facets, facets, last_modified)
+
+    categories = sorted({project.category for project in resources["/api/projects/"].content})
+    for category in categories:
+        resources[f"/api/projects/category/{category}"] = await get_active_projects(category)
+
+    return resources
+
+
+def _file_name(path: str) -> str:
+    return quote(path.strip("/"), safe="") or "index"
+
+
+def write_snapshot(resources: dict, directory: Path) -> str:
+    """Write the resources to a new version directory and make it current"""
+    digest = hashlib.sha256()
+    for path in sorted(resources):
+        digest.update(f"{path}={resources[path].etag};".encode())
+    version = digest.hexdigest()[:16]
+
+    version_dir = directory / version
+    version_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest = {"version": version, "created_at": datetime.utcnow().isoformat(), "endpoints": {}}
+    for path, resource in resources.items():
+        name = _file_name(path)
+        (version_dir / f"{name}.json").write_bytes(resource.body)
+        encodings = []
+        for encoding in ENCODINGS:
+            if encoding == "br" and brotli is None:
+                continue
+            # Compressed once at export time, so spend CPU on the best ratio
+            (version_dir / f"{name}.json.{encoding}").write_bytes(compress(resource.body, encoding, best=True))
+            encodings.append(encoding)
+
+        manifest["endpoints"][path] = {
+            "file": f"{name}.json",
+            "encodings": encodings,
+            "etag": resource.etag,
+            "last_modified": resource.last_modified.isoformat() if resource.last_modified else None,
+        }
+
+    (version_dir / MANIFEST).write_text(json.dumps(manifest, indent=2))
+
+    # Switch the current version atomically
+    pointer = directory / f"{CURRENT}.tmp"
+    pointer.write_text(version)
+    os.replace(pointer, directory / CURRENT)
+    return version
+
+
+def load_snapshot(directory: Path) -> dict:
+    """Load the current snapshot into memory as resources keyed by URL path"""
+    version = (directory / CURRENT).read_text().strip()
+    version_dir = directory / version
+    manifest = json.loads((version_dir / MANIFEST).read_text())
+
+    resources = {}
+    for path, entry in manifest["endpoints"].items():
+        body = (version_dir / entry["file"]).read_bytes()
+        compressed = {
+            encoding: (version_dir / f"{entry['file']}.{encoding}").read_bytes()
+            for encoding in entry["encodings"]
+        }
+        last_modified = datetime.fromisoformat(entry["last_modified"]) if entry["last_modified"] else None
+        resources[path] = Resource.from_encoded(body, compressed, entry["etag"], last_modified)
+    return resources
+
+
+def create_snapshot_app(directory: Path):
+    """Build an app answering the public GET endpoints from a snapshot"""
+    from fastapi import FastAPI, Request
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse
+
+    resources = load_snapshot(directory)
+    app = FastAPI(title="Portfolio API (snapshot)", docs_url=None, redoc_url=None, openapi_url=None)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_credentials=True,
+        allow_origins=["*"],
+        allow_methods=["GET", "HEAD"],
+        allow_headers=["*"],
+    )
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy", "service": "portfolio-api-snapshot", "endpoints": len(resources)}
+
+    @app.get("/{path:path}")
+    async def serve_snapshot(path: str, request: Request):
+        path = "/" + path
+        resource = resources.get(path) or resources.get(path + "/")
+        if resource is None:
+            return JSONResponse({"detail": "Not Found"}, status_code=404)
+        # Only the unfiltered endpoints are exported, so filters such as
+        # ?technology= cannot be honored; refuse rather than ignore them
+        if request.url.query:
+            return JSONResponse(
+                {"detail": "Query parameters are not supported when serving a snapshot"}, status_code=400
+            )
+        return encoded_response(request, resource)
+
+    return app
+
+
+async def export(directory: Path):
+    from database import close_db_connection
+
+    try:
+        resources = await render_endpoints()
+    finally:
+        await close_db_connection()
+    version = write_snapshot(resources, directory)
+    print(f"Exported {len(resources)} endpoints to {directory / version}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or serve static snapshots of the public API")
+    parser.add_argument("--dir", default=DEFAULT_SNAPSHOT_DIR, type=Path, help="snapshot directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("export", help="render every public GET endpoint to disk")
+    serve = commands.add_parser("serve", help="serve the current snapshot without MongoDB")
+    serve.add_argument("--host", default="0.0.0.0")
+    serve.add_argument("--port", default=8001, type=int)
+    args = parser.parse_args()
+
+    if args.command == "export":
+        asyncio.run(export(args.dir))
+    else:
+        import uvicorn
+        uvicorn.run(create_snapshot_app(args.dir), host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from pymongo import UpdateOne
+from database import (
+    personal_info_collection, experience_collection, project_collection,
+    skill_collection, achievement_collection, education_collection
+)
+from models.PersonalInfo import PersonalInfo, PersonalInfoCreate
+from models.Experience import Experience, ExperienceCreate
+from models.Project import Project, ProjectCreate
+from models.Skill import Skill, SkillCreate
+from models.Achievement import Achievement, AchievementCreate
+from models.Education import Education, EducationCreate
+from codec import to_document
+from coherency import generation_watcher
+
+try:
+    import yaml
+except ImportError:  # YAML content files are optional
+    yaml = None
+
+DEFAULT_CONTENT_FILE = Path(__file__).parent / "content" / "portfolio.json"
+
+# Section of the content file -> (collection, create model, stored model, stable key fields).
+# Personal info is a singleton, so every document shares the empty key.
+SECTIONS = {
+    "personal_info": (personal_info_collection, PersonalInfoCreate, PersonalInfo, ()),
+    "experience": (experience_collection, ExperienceCreate, Experience, ("company", "position")),
+    "education": (education_collection, EducationCreate, Education, ("degree", "school")),
+    "projects": (project_collection, ProjectCreate, Project, ("title",)),
+    "skills": (skill_collection, SkillCreate, Skill, ("category",)),
+    "achievements": (achievement_collection, AchievementCreate, Achievement, ("title", "organization")),
+}
+
+
+def load_content(path: Path) -> dict:
+    """Load portfolio content from a JSON or YAML file"""
+    text = Path(path).read_text(encoding="utf-8")
+    if Path(path).suffix in (".yaml", ".yml"):
+        if yaml is None:
+            raise RuntimeError("PyYAML is required to read YAML content files")
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+def plan_section(entries, stored_documents, create_model, stored_model, key_fields):
+    """Diff the desired entries against the stored documents.
+
+    Returns the bulk operations to apply and a summary of the changes.
+    Unchanged documents get no operation, so their ``updated_at`` and the
+    HTTP validators derived from it stay stable.
+    """
+    if isinstance(entries, dict):
+        entries = [entries]
+
+    def key_of(document):
+        return tuple(document.get(field) for field in key_fields)
+
+    # Prefer the active copy when several stored documents share a key
+    stored = {}
+    duplicates = []
+    for document in sorted(stored_documents, key=lambda document: not document.get("is_active", False)):
+        if key_of(document) in stored:
+            duplicates.append(document)
+        else:
+            stored[key_of(document)] = document
+
+    now = datetime.utcnow()
+    operations = []
+    summary = {"inserted": 0, "updated": 0, "deactivated": 0, "unchanged": 0}
+    seen = set()
+
+    for entry in entries:
+        fields = create_model(**entry).model_dump()
+        key = key_of(fields)
+        if key in seen:
+            raise ValueError(f"Duplicate entry for key {key!r} in {create_model.__name__}")
+        seen.add(key)
+
+        existing = stored.get(key)
+        if existing is None:
+            document = to_document(stored_model(**fields))
+            operations.append(UpdateOne(
+                {"_id": document.pop("_id")},
+                {"$setOnInsert": document},
+                upsert=True,
+            ))
+            summary["inserted"] += 1
+        elif existing.get("is_active") and all(existing.get(name) == value for name, value in fields.items()):
+            summary["unchanged"] += 1
+        else:
+            operations.append(UpdateOne(
+                {"_id": existing["_id"]},
+                {"$set": {**fields, "is_active": True, "updated_at": now}},
+            ))
+            summary["updated"] += 1
+
+    # Soft delete whatever is no longer in the content file
+    for document in duplicates + [document for key, document in stored.items() if key not in seen]:
+        if document.get("is_active"):
+            operations.append(UpdateOne(
+                {"_id": document["_id"]},
+                {"$set": {"is_active": False, "updated_at": now}},
+            ))
+            summary["deactivated"] += 1
+
+    return operations, summary
+
+
+async def sync_section(name, entries, dry_run=False):
+    collection, create_model, stored_model, key_fields = SECTIONS[name]
+    started = time.perf_counter()
+
+    stored_documents = await collection.find().to_list(None)
+    operations, summary = plan_section(entries, stored_documents, create_model, stored_model, key_fields)
+    if operations and not dry_run:
+        await collection.bulk_write(operations, ordered=False)
+        # Running API workers drop their cached copy of the section
+        await generation_watcher.bump(name)
+
+    summary["seconds"] = time.perf_counter() - started
+    return name, summary
+
+
+async def sync_content(content: dict, dry_run=False) -> dict:
+    """Apply the content of every section concurrently"""
+    unknown = set(content) - set(SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown content sections: {', '.join(sorted(unknown))}")
+
+    results = await asyncio.gather(*(
+        sync_section(name, entries, dry_run) for name, entries in content.items()
+    ))
+    return dict(results)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Sync portfolio content from a JSON/YAML file into MongoDB")
+    parser.add_argument("path", nargs="?", default=DEFAULT_CONTENT_FILE, type=Path, help="content file to apply")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would change")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    results = await sync_content(load_content(args.path), dry_run=args.dry_run)
+    for name, summary in results.items():
+        print(
+            f"{name:<14} +{summary['inserted']} ~{summary['updated']} -{summary['deactivated']} "
+            f"={summary['unchanged']} ({summary['seconds'] * 1000:.1f} ms)"
+        )
+    print(f"{'Planned' if args.dry_run else 'Synced'} content in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    asyncio.run(main())
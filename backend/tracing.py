@@ -0,0 +1,135 @@
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dotenv import load_dotenv
+from pymongo import monitoring
+
+load_dotenv()
+
+logger = logging.getLogger("trace")
+
+# Per-request timing spans, reported as a Server-Timing header and optionally
+# as one JSON log line per request.
+#
+# Spans: routing (until the endpoint's dependencies run), db (every MongoDB
+# command), model (building models from documents), encode (JSON) and
+# compress (gzip/Brotli). Cached responses skip most of them.
+
+server_timing_enabled = os.environ.get('SERVER_TIMING_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+trace_log_enabled = os.environ.get('TRACE_LOG_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+tracing_enabled = server_timing_enabled or trace_log_enabled
+
+_current_trace = ContextVar("trace", default=None)
+
+
+class Trace:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans = {}
+
+    def add(self, name: str, seconds: float):
+        # Called from Motor's executor threads too; the GIL keeps this consistent
+        total, count = self.spans.get(name, (0.0, 0))
+        self.spans[name] = (total + seconds, count + 1)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        entries = []
+        for name, (seconds, count) in list(self.spans.items()):
+            entry = f"{name};dur={seconds * 1000:.2f}"
+            if count > 1:
+                entry += f';desc="{count}x"'
+            entries.append(entry)
+        entries.append(f"total;dur={self.elapsed() * 1000:.2f}")
+        return ", ".join(entries)
+
+
+@contextmanager
+def span(name: str):
+    """Add the duration of the block to the current request's trace"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, time.perf_counter() - started)
+
+
+async def handler_started():
+    """App-wide dependency closing the routing span"""
+    trace = _current_trace.get()
+    if trace is not None and "routing" not in trace.spans:
+        trace.add("routing", trace.elapsed())
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware collecting the spans of each request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if server_timing_enabled:
+                    message.setdefault("headers", []).append((b"server-timing", trace.server_timing().encode()))
+            await send(message)
+
+        token = _current_trace.set(trace)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_trace.reset(token)
+            if trace_log_enabled:
+                route = scope.get("route")
+                logger.info(json.dumps({
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": getattr(route, "path", None),
+                    "status": status,
+                    "total_ms": round(trace.elapsed() * 1000, 2),
+                    "spans": {
+                        name: {"ms": round(seconds * 1000, 2), "count": count}
+                        for name, (seconds, count) in trace.spans.items()
+                    },
+                }))
+
+
+class TracingCommandListener(monitoring.CommandListener):
+    """Adds every MongoDB command to the trace of the request that issued it.
+
+    Motor runs commands on executor threads with a copy of the caller's
+    context, so the current trace is visible here.
+    """
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add("db", event.duration_micros / 1_000_000)
+
+    def failed(self, event):
+        self.succeeded(event)
+
+
+tracing_command_listener = TracingCommandListener()
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import os
+from dotenv import load_dotenv
+from pymongo.errors import BulkWriteError
+from database import contact_message_collection
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Write-behind configuration for contact form submissions
+contact_write_behind = os.environ.get('CONTACT_WRITE_BEHIND', 'false').lower() in ('1', 'true', 'yes')
+contact_batch_size = int(os.environ.get('CONTACT_BATCH_SIZE', '100'))
+contact_flush_interval = float(os.environ.get('CONTACT_FLUSH_INTERVAL', '0.5'))
+contact_queue_size = int(os.environ.get('CONTACT_QUEUE_SIZE', '10000'))
+
+_STOP = object()
+
+
+class BufferFull(Exception):
+    """Raised when the write-behind queue cannot take more documents"""
+
+
+class WriteBehindBuffer:
+    """Buffers documents in memory and stores them with batched ``insert_many``.
+
+    A batch is flushed once it reaches ``batch_size`` documents or once its
+    oldest document has waited ``flush_interval`` seconds. ``stop()`` flushes
+    everything still queued.
+    """
+
+    def __init__(self, collection, batch_size: int, flush_interval: float, max_pending: int, retries: int = 3):
+        self.collection = collection
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retries = retries
+        self._queue = asyncio.Queue(maxsize=max_pending)
+        self._task = None
+        self._closing = False
+        self.flushed = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def start(self):
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+
+    def submit(self, document: dict):
+        """Queue a document without waiting for the database"""
+        if self._closing or self._task is None:
+            raise BufferFull("Write-behind buffer is not running")
+        try:
+            self._queue.put_nowait(document)
+        except asyncio.QueueFull:
+            raise BufferFull("Write-behind buffer is full")
+
+    async def stop(self):
+        """Flush every queued document and stop the background task"""
+        if self._task is None:
+            return
+        self._closing = True
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            if batch[-1] is _STOP:
+                batch.pop()
+                stopping = True
+            if batch:
+                await self._flush(batch)
+
+    async def _flush(self, batch):
+        for attempt in range(1, self.retries + 1):
+            try:
+                await self.collection.insert_many(batch, ordered=False)
+                self.flushed += len(batch)
+                return
+            except BulkWriteError as error:
+                # Duplicate keys mean an earlier attempt already stored the document
+                failed = {e["index"] for e in error.details["writeErrors"] if e.get("code") != 11000}
+                self.flushed += len(batch) - len(failed)
+                batch = [document for index, document in enumerate(batch) if index in failed]
+                if not batch:
+                    return
+                logger.warning("Write-behind flush left %d documents unwritten (attempt %d)", len(batch), attempt)
+            except Exception:
+                logger.exception("Write-behind flush of %d documents failed (attempt %d)", len(batch), attempt)
+            if attempt < self.retries:
+                await asyncio.sleep(min(0.1 * 2 ** attempt, 2))
+
+        self.dropped += len(batch)
+        logger.error("Dropped %d buffered documents: %s", len(batch), [document["_id"] for document in batch])
+
+
+contact_write_buffer = (
+    WriteBehindBuffer(contact_message_collection, contact_batch_size, contact_flush_interval, contact_queue_size)
+    if contact_write_behind else None
+)
@@ -553,10 +553,10 @@ class PortfolioAPITester:
             response = requests.get(f"{self.base_url}/contact/messages")
             if response.status_code == 200:
                 data = response.json()
-                if isinstance(data, list):
-                    self.log_result("GET All Contact Messages", True, f"Retrieved {len(data)} messages")
+                if isinstance(data.get("messages"), list) and "total" in data and "unread" in data:
+                    self.log_result("GET All Contact Messages", True, f"Retrieved {len(data['messages'])} of {data['total']} messages")
                 else:
-                    self.log_result("GET All Contact Messages", False, "Response is not a list")
+                    self.log_result("GET All Contact Messages", False, "Response is not a message page")
             else:
                 self.log_result("GET All Contact Messages", False, f"Status: {response.status_code}", response)
         except Exception as e:
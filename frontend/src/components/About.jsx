@@ -1,13 +1,13 @@
 import React from 'react';
-import { personalInfoApi, achievementsApi } from '../services/api';
+import { portfolioApi } from '../services/api';
 import { useApi } from '../hooks/useApi';
 import { Award, Users, GraduationCap } from 'lucide-react';
 import { LoadingSection, LoadingCard } from './LoadingSpinner';
 import ErrorMessage from './ErrorMessage';
 
 const About = () => {
-  const { data: personalInfo, loading: personalLoading, error: personalError, refetch: refetchPersonal } = useApi(() => personalInfoApi.get());
-  const { data: achievements, loading: achievementsLoading, error: achievementsError, refetch: refetchAchievements } = useApi(() => achievementsApi.getAll());
+  const { data: personalInfo, loading: personalLoading, error: personalError, refetch: refetchPersonal } = useApi(() => portfolioApi.get().then((portfolio) => portfolio.personal_info));
+  const { data: achievements, loading: achievementsLoading, error: achievementsError, refetch: refetchAchievements } = useApi(() => portfolioApi.get().then((portfolio) => portfolio.achievements));
 
   const stats = [
     { number: '4+', label: 'Years Experience', icon: GraduationCap },
@@ -1,5 +1,5 @@
 import React, { useState } from 'react';
-import { personalInfoApi, contactApi } from '../services/api';
+import { portfolioApi, contactApi } from '../services/api';
 import { useApi, useApiMutation } from '../hooks/useApi';
 import { Mail, Phone, MapPin, Github, Linkedin, Send, MessageCircle } from 'lucide-react';
 import { Button } from './ui/button';
@@ -12,7 +12,7 @@ import ErrorMessage from './ErrorMessage';
 
 const Contact = () => {
   const { toast } = useToast();
-  const { data: personalInfo, loading, error, refetch } = useApi(() => personalInfoApi.get());
+  const { data: personalInfo, loading, error, refetch } = useApi(() => portfolioApi.get().then((portfolio) => portfolio.personal_info));
   const { mutate: submitContact, loading: isSubmitting } = useApiMutation();
   
   const [formData, setFormData] = useState({
@@ -1,13 +1,13 @@
 import React from 'react';
-import { experienceApi, educationApi } from '../services/api';
+import { portfolioApi } from '../services/api';
 import { useApi } from '../hooks/useApi';
 import { Building2, Calendar, MapPin, Briefcase, GraduationCap } from 'lucide-react';
 import { LoadingSection, LoadingCard } from './LoadingSpinner';
 import ErrorMessage from './ErrorMessage';
 
 const Experience = () => {
-  const { data: experience, loading: expLoading, error: expError, refetch: refetchExp } = useApi(() => experienceApi.getAll());
-  const { data: education, loading: eduLoading, error: eduError, refetch: refetchEdu } = useApi(() => educationApi.getAll());
+  const { data: experience, loading: expLoading, error: expError, refetch: refetchExp } = useApi(() => portfolioApi.get().then((portfolio) => portfolio.experience));
+  const { data: education, loading: eduLoading, error: eduError, refetch: refetchEdu } = useApi(() => portfolioApi.get().then((portfolio) => portfolio.education));
 
   // Handle loading state
   if (expLoading || eduLoading) {
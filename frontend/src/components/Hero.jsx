@@ -1,13 +1,13 @@
 import React from 'react';
 import { ArrowDown, Github, Linkedin, Mail, MapPin } from 'lucide-react';
 import { Button } from './ui/button';
-import { personalInfoApi } from '../services/api';
+import { portfolioApi } from '../services/api';
 import { useApi } from '../hooks/useApi';
 import { LoadingSection } from './LoadingSpinner';
 import ErrorMessage from './ErrorMessage';
 
 const Hero = () => {
-  const { data: personalInfo, loading, error, refetch } = useApi(() => personalInfoApi.get());
+  const { data: personalInfo, loading, error, refetch } = useApi(() => portfolioApi.get().then((portfolio) => portfolio.personal_info));
 
   const scrollToAbout = () => {
     const aboutSection = document.querySelector('#about');
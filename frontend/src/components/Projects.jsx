@@ -1,5 +1,5 @@
 import React, { useState, useMemo } from 'react';
-import { projectsApi } from '../services/api';
+import { portfolioApi } from '../services/api';
 import { useApi } from '../hooks/useApi';
 import { Github, ExternalLink, Code, Brain, Layers } from 'lucide-react';
 import { Button } from './ui/button';
@@ -10,7 +10,7 @@ import ErrorMessage from './ErrorMessage';
 
 const Projects = () => {
   const [selectedCategory, setSelectedCategory] = useState('All');
-  const { data: projects, loading, error, refetch } = useApi(() => projectsApi.getAll());
+  const { data: projects, loading, error, refetch } = useApi(() => portfolioApi.get().then((portfolio) => portfolio.projects));
   
   // Get unique categories from projects
   const categories = useMemo(() => {
@@ -1,12 +1,12 @@
 import React from 'react';
-import { skillsApi } from '../services/api';
+import { portfolioApi } from '../services/api';
 import { useApi } from '../hooks/useApi';
 import { Code, Database, Cloud, Settings, Cpu, BarChart3 } from 'lucide-react';
 import { LoadingSection, LoadingCard } from './LoadingSpinner';
 import ErrorMessage from './ErrorMessage';
 
 const Skills = () => {
-  const { data: skills, loading, error, refetch } = useApi(() => skillsApi.getAll());
+  const { data: skills, loading, error, refetch } = useApi(() => portfolioApi.get().then((portfolio) => portfolio.skills));
 
   // Icon mapping for skill categories
   const getSkillCategoryIcon = (category) => {
@@ -32,6 +32,25 @@ apiClient.interceptors.response.use(
   }
 );
 
+// Portfolio API
+// The whole page is rendered from a single snapshot request; sections share
+// the in-flight promise so mounting them together costs one round trip.
+let portfolioSnapshot = null;
+
+export const portfolioApi = {
+  get: async ({ refresh = false } = {}) => {
+    if (!portfolioSnapshot || refresh) {
+      portfolioSnapshot = apiClient.get('/portfolio/')
+        .then((response) => response.data)
+        .catch((error) => {
+          portfolioSnapshot = null;
+          throw error;
+        });
+    }
+    return portfolioSnapshot;
+  },
+};
+
 // Personal Information API
 export const personalInfoApi = {
   get: async () => {
@@ -46,8 +65,9 @@ export const personalInfoApi = {
 
 // Experience API
 export const experienceApi = {
-  getAll: async () => {
-    const response = await apiClient.get('/experience/');
+  getAll: async (params = {}) => {
+    // params: { technology: ['Python', 'React'], match: 'all' | 'any' }
+    const response = await apiClient.get('/experience/', { params, paramsSerializer: { indexes: null } });
     return response.data;
   },
   create: async (data) => {
@@ -66,8 +86,13 @@ export const experienceApi = {
 
 // Projects API
 export const projectsApi = {
-  getAll: async () => {
-    const response = await apiClient.get('/projects/');
+  getAll: async (params = {}) => {
+    // params: { technology: ['Python', 'React'], match: 'all' | 'any' }
+    const response = await apiClient.get('/projects/', { params, paramsSerializer: { indexes: null } });
+    return response.data;
+  },
+  getCategories: async () => {
+    const response = await apiClient.get('/projects/categories');
     return response.data;
   },
   getByCategory: async (category) => {
@@ -154,8 +179,9 @@ export const contactApi = {
     const response = await apiClient.post('/contact/', data);
     return response.data;
   },
-  getMessages: async () => {
-    const response = await apiClient.get('/contact/messages');
+  // params: { after, limit, is_read, since, until }
+  getMessages: async (params = {}) => {
+    const response = await apiClient.get('/contact/messages', { params });
     return response.data;
   },
   markAsRead: async (id) => {
@@ -164,6 +190,22 @@ export const contactApi = {
   },
 };
 
+// Search API
+export const searchApi = {
+  search: async (q, params = {}) => {
+    const response = await apiClient.get('/search/', { params: { q, ...params } });
+    return response.data;
+  },
+};
+
+// Technologies API
+export const technologiesApi = {
+  getAll: async () => {
+    const response = await apiClient.get('/technologies/');
+    return response.data;
+  },
+};
+
 // Helper function to handle API errors
 export const handleApiError = (error, fallbackMessage = 'An error occurred') => {
   if (error.response?.data?.detail) {
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Closed-loop load generator for the Portfolio API.
+
+Replays a realistic traffic mix against a running server at increasing
+concurrency levels and prints the throughput vs latency curve, so the
+saturation knee and the requests/sec a worker sustains within a latency
+SLO can be read off directly.
+
+    python load_test.py --url http://localhost:8001/api
+    python load_test.py --levels 1 2 4 8 16 32 64 --duration 20 --slo-ms 200 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+
+import httpx
+
+BASE_URL = "http://localhost:8001/api"
+
+# (weight, method, path, body factory); mostly reads with a trickle of contact submissions
+TRAFFIC_MIX = [
+    (25, "GET", "/personal/", None),
+    (25, "GET", "/projects/", None),
+    (20, "GET", "/skills/", None),
+    (10, "GET", "/experience/", None),
+    (8, "GET", "/portfolio/", None),
+    (4, "GET", "/education/", None),
+    (4, "GET", "/achievements/", None),
+    (3, "GET", "/search/?q=python", None),
+    (1, "POST", "/contact/", lambda: {
+        "name": "Load Test",
+        "email": f"load-{uuid.uuid4().hex[:12]}@example.com",
+        "subject": "Load test",
+        "message": "Generated by load_test.py",
+    }),
+]
+
+
+def percentile(values, p):
+    if len(values) < 2:
+        return round(values[0] * 1000, 3) if values else None
+    return round(statistics.quantiles(values, n=100, method="inclusive")[p - 1] * 1000, 3)
+
+
+async def run_level(base_url, mix, concurrency, duration, warmup, think_time):
+    """Run ``concurrency`` virtual users for ``duration`` seconds and summarise"""
+    weights = [entry[0] for entry in mix]
+    latencies = []
+    statuses = Counter()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        measuring_from = time.perf_counter() + warmup
+        stop_at = measuring_from + duration
+
+        async def user():
+            while True:
+                _, method, path, body = random.choices(mix, weights)[0]
+                started = time.perf_counter()
+                if started >= stop_at:
+                    return
+                try:
+                    response = await client.request(method, path, json=body() if body else None)
+                    status = response.status_code
+                except httpx.HTTPError as error:
+                    status = type(error).__name__
+                finished = time.perf_counter()
+                if started >= measuring_from:
+                    statuses[status] += 1
+                    if isinstance(status, int) and status < 400:
+                        latencies.append(finished - started)
+                if think_time:
+                    await asyncio.sleep(random.expovariate(1 / think_time))
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+
+    total = sum(statuses.values())
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "throughput_rps": round(len(latencies) / duration, 1),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "rate_limited": statuses.get(429, 0),
+        "errors": sum(count for status, count in statuses.items()
+                      if not isinstance(status, int) or (status >= 400 and status != 429)),
+        "statuses": {str(status): count for status, count in statuses.items()},
+    }
+
+
+def find_knee(results, slo_ms):
+    """Best level within the SLO, and the level where extra users stop adding throughput"""
+    within_slo = [r for r in results if r["p95_ms"] is not None and r["p95_ms"] <= slo_ms]
+    best = max(within_slo, key=lambda r: r["throughput_rps"], default=None)
+
+    knee = None
+    for previous, current in zip(results, results[1:]):
+        if current["throughput_rps"] < previous["throughput_rps"] * 1.1:
+            knee = previous
+            break
+    return best, knee
+
+
+def _ms(value):
+    return f"{value:8.1f}" if value is not None else f"{'-':>8}"
+
+
+def print_curve(results):
+    peak = max((r["throughput_rps"] for r in results), default=0) or 1
+    print(f"{'users':>6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'429':>6} {'errors':>6}")
+    for r in results:
+        bar = "#" * int(40 * r["throughput_rps"] / peak)
+        print(
+            f"{r['concurrency']:>6} {r['throughput_rps']:>9.1f} {_ms(r['p50_ms'])} {_ms(r['p95_ms'])}"
+            f" {_ms(r['p99_ms'])} {r['rate_limited']:>6} {r['errors']:>6}  {bar}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep concurrency against a running Portfolio API")
+    parser.add_argument("--url", default=BASE_URL, help="API base URL")
+    parser.add_argument("--levels", nargs="+", type=int, default=[1, 2, 4, 8, 16, 32, 64],
+                        help="concurrent virtual users per step")
+    parser.add_argument("--duration", default=10.0, type=float, help="measured seconds per step")
+    parser.add_argument("--warmup", default=2.0, type=float, help="unmeasured seconds at the start of each step")
+    parser.add_argument("--think-time", default=0.0, type=float, help="mean pause between a user's requests (s)")
+    parser.add_argument("--reads-only", action="store_true", help="leave contact submissions out of the mix")
+    parser.add_argument("--slo-ms", default=200.0, type=float, help="p95 latency objective")
+    parser.add_argument("--workers", default=1, type=int, help="server worker processes, for per-worker numbers")
+    parser.add_argument("--output", help="write the curve to this JSON file")
+    args = parser.parse_args()
+
+    mix = [entry for entry in TRAFFIC_MIX if not (args.reads_only and entry[1] != "GET")]
+    print(f"Load testing {args.url}: {args.duration:g}s per step, p95 SLO {args.slo_ms:g} ms")
+
+    results = []
+    for level in args.levels:
+        result = asyncio.run(run_level(args.url, mix, level, args.duration, args.warmup, args.think_time))
+        results.append(result)
+        print(f"  {level} users: {result['throughput_rps']} req/s, p95 {result['p95_ms'] or 0:.1f} ms")
+
+    print()
+    print_curve(results)
+    best, knee = find_knee(results, args.slo_ms)
+    print()
+    if knee:
+        print(f"Saturation knee: ~{knee['concurrency']} users at {knee['throughput_rps']} req/s")
+    else:
+        print("No saturation knee found, try higher --levels")
+    if best:
+        per_worker = best["throughput_rps"] / args.workers
+        print(
+            f"Within the {args.slo_ms:g} ms p95 SLO: {best['throughput_rps']} req/s at {best['concurrency']} users"
+            f" ({per_worker:.1f} req/s per worker)"
+        )
+    else:
+        print(f"No level met the {args.slo_ms:g} ms p95 SLO")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"url": args.url, "slo_ms": args.slo_ms, "workers": args.workers, "results": results}, f, indent=2)
+        print(f"Curve written to {args.output}")
+
+    if any(r["errors"] for r in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
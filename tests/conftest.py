@@ -0,0 +1,31 @@
+import os
+import sys
+from pathlib import Path
+
+# The backend modules import each other as top-level modules and read their
+# settings from the environment at import time, so both are set up here,
+# before any test module imports them. MongoDB is replaced by
+# mongomock-motor, the in-memory stand-in the benchmark suite uses too.
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+
+TEST_ENVIRONMENT = {
+    "MONGO_URL": "mongodb://tests",
+    "DB_NAME": "portfolio_tests",
+    "CONTACT_RATE_PER_MINUTE": "0",
+    "CONTACT_EMAIL_RATE_PER_MINUTE": "0",
+    "WRITE_RATE_PER_MINUTE": "0",
+    "CONCURRENCY_LIMIT_ENABLED": "false",
+    "CACHE_GENERATION_POLL_INTERVAL": "0",
+    "PROFILE_ENABLED": "false",
+    "SLOW_QUERY_MS": "0",
+}
+
+for name, value in TEST_ENVIRONMENT.items():
+    os.environ[name] = value
+
+import motor.motor_asyncio
+from mongomock_motor import AsyncMongoMockClient
+
+motor.motor_asyncio.AsyncIOMotorClient = AsyncMongoMockClient
+sys.path.insert(0, str(BACKEND_DIR))
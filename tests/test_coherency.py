@@ -0,0 +1,60 @@
+import asyncio
+
+import httpx
+import pytest
+
+from cache import read_cache
+from database import experience_collection, project_collection
+from facets import build_technology_index
+from routes import experience
+from search import build_search_index
+from server import app
+
+NEW_PROJECT = {
+    "title": "Compiler in Rust",
+    "description": "A project written while an index was being rebuilt",
+    "long_description": "A longer description of the project written during the rebuild",
+    "technologies": ["Rust"],
+    "features": ["Concurrent"],
+    "github": "https://github.com/example/compiler",
+    "demo": "https://example.com/compiler",
+    "image": "https://example.com/compiler.png",
+    "category": "Testing",
+    "order": 1,
+}
+
+
+async def _write_during_rebuild(monkeypatch, rebuild, path):
+    await project_collection.delete_many({})
+    await experience_collection.delete_many({})
+    read_cache.clear()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://tests") as client:
+        await rebuild()
+
+        # The rebuild loads projects first, so this write lands mid-rebuild
+        get_active_experiences = experience.get_active_experiences
+        created = []
+
+        async def get_active_experiences_after_a_write():
+            if not created:
+                created.append(await client.post("/api/projects/", json=NEW_PROJECT))
+            return await get_active_experiences()
+
+        monkeypatch.setattr(experience, "get_active_experiences", get_active_experiences_after_a_write)
+        await rebuild()
+        monkeypatch.setattr(experience, "get_active_experiences", get_active_experiences)
+
+        assert created[0].status_code == 200
+        return (await client.get(path)).json()
+
+
+@pytest.mark.parametrize("rebuild, path, titles", [
+    (build_technology_index, "/api/projects/?technology=Rust", lambda body: [p["title"] for p in body]),
+    (build_search_index, "/api/search/?q=compiler", lambda body: [hit["title"] for hit in body["hits"]]),
+])
+def test_write_during_rebuild_is_kept(monkeypatch, rebuild, path, titles):
+    body = asyncio.run(_write_during_rebuild(monkeypatch, rebuild, path))
+
+    assert titles(body) == [NEW_PROJECT["title"]]
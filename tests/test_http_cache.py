@@ -0,0 +1,57 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+
+from cache import read_cache
+from codec import to_document
+from database import project_collection
+from http_cache import _http_date
+from models.Project import Project
+from server import app
+
+EARLIER = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _project(title: str, order: int) -> Project:
+    return Project(
+        title=title,
+        description=f"{title} description",
+        long_description=f"{title} long description",
+        technologies=["Python"],
+        features=["Tested"],
+        github="https://github.com/example/project",
+        demo="https://example.com/project",
+        image="https://example.com/project.png",
+        category="Testing",
+        order=order,
+        created_at=EARLIER,
+        updated_at=EARLIER,
+    )
+
+
+async def _revalidate_after_delete():
+    await project_collection.delete_many({})
+    read_cache.clear()
+    first, second = _project("First", 1), _project("Second", 2)
+    await project_collection.insert_many([to_document(first), to_document(second)])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://tests") as client:
+        before = await client.get("/api/projects/")
+        deleted = await client.delete(f"/api/projects/{second.id}")
+        after = await client.get(
+            "/api/projects/", headers={"If-Modified-Since": before.headers["last-modified"]}
+        )
+    return before, deleted, after
+
+
+def test_soft_delete_is_not_revalidated_as_unmodified():
+    before, deleted, after = asyncio.run(_revalidate_after_delete())
+
+    assert before.status_code == 200
+    assert before.headers["last-modified"] == _http_date(EARLIER)
+    assert deleted.status_code == 200
+    assert after.status_code == 200
+    assert [project["title"] for project in after.json()] == ["First"]
+    assert after.headers["last-modified"] != before.headers["last-modified"]
@@ -0,0 +1,79 @@
+import pytest
+
+from codec import to_document
+from models.Skill import Skill, SkillCreate
+from sync_content import plan_section
+
+KEY_FIELDS = ("category",)
+
+ENTRIES = [
+    {"category": "Languages", "skills": ["Python", "JavaScript"], "order": 1},
+    {"category": "Databases", "skills": ["MongoDB"], "order": 2},
+]
+
+
+def _stored(entry, is_active=True):
+    return to_document(Skill(**entry, is_active=is_active))
+
+
+def _plan(entries, stored_documents):
+    return plan_section(entries, stored_documents, SkillCreate, Skill, KEY_FIELDS)
+
+
+def test_first_sync_inserts_every_entry():
+    operations, summary = _plan(ENTRIES, [])
+
+    assert summary == {"inserted": 2, "updated": 0, "deactivated": 0, "unchanged": 0}
+    assert [operation._doc["$setOnInsert"]["category"] for operation in operations] == ["Languages", "Databases"]
+    assert all(operation._upsert for operation in operations)
+
+
+def test_rerunning_the_sync_is_a_no_op():
+    operations, summary = _plan(ENTRIES, [_stored(entry) for entry in ENTRIES])
+
+    assert operations == []
+    assert summary == {"inserted": 0, "updated": 0, "deactivated": 0, "unchanged": 2}
+
+
+def test_changed_field_produces_a_single_set():
+    stored = [_stored(entry) for entry in ENTRIES]
+    changed = [{**ENTRIES[0], "skills": ["Python", "Go"]}, ENTRIES[1]]
+
+    operations, summary = _plan(changed, stored)
+
+    assert summary == {"inserted": 0, "updated": 1, "deactivated": 0, "unchanged": 1}
+    [operation] = operations
+    assert operation._filter == {"_id": stored[0]["_id"]}
+    assert list(operation._doc) == ["$set"]
+    assert operation._doc["$set"]["skills"] == ["Python", "Go"]
+    assert operation._doc["$set"]["is_active"] is True
+
+
+def test_duplicates_are_deactivated_and_the_active_copy_kept():
+    inactive = _stored(ENTRIES[0], is_active=False)
+    kept = _stored(ENTRIES[0])
+    duplicate = _stored(ENTRIES[0])
+
+    operations, summary = _plan(ENTRIES[:1], [inactive, kept, duplicate])
+
+    assert summary == {"inserted": 0, "updated": 0, "deactivated": 1, "unchanged": 1}
+    [operation] = operations
+    assert operation._filter == {"_id": duplicate["_id"]}
+    assert operation._doc["$set"]["is_active"] is False
+
+
+def test_removed_entry_is_deactivated():
+    stored = [_stored(entry) for entry in ENTRIES]
+
+    operations, summary = _plan(ENTRIES[:1], stored)
+
+    assert summary == {"inserted": 0, "updated": 0, "deactivated": 1, "unchanged": 1}
+    [operation] = operations
+    assert operation._filter == {"_id": stored[1]["_id"]}
+    assert operation._doc["$set"]["is_active"] is False
+    assert "updated_at" in operation._doc["$set"]
+
+
+def test_duplicate_key_in_the_content_file_raises():
+    with pytest.raises(ValueError, match="Duplicate entry"):
+        _plan([ENTRIES[0], {**ENTRIES[0], "order": 3}], [])